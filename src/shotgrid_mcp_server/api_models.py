@@ -8,6 +8,7 @@ https://developers.shotgridsoftware.com/python-api/reference.html
 """
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -15,6 +16,15 @@ from pydantic import BaseModel, ConfigDict, Field, field_validator, model_valida
 from shotgrid_mcp_server.custom_types import EntityType
 from shotgrid_mcp_server.models import TimeFilter
 
+# Relative time operators whose value is a [count, unit] pair
+_TIME_FILTER_OPERATORS = frozenset({"in_last", "not_in_last", "in_next", "not_in_next"})
+
+
+# Pattern for datetime without timezone: "YYYY-MM-DD HH:MM:SS"
+_DATETIME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}$")
+# Pattern for date only: "YYYY-MM-DD"
+_DATE_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def _normalize_datetime_value(value: Any) -> Any:
     """Normalize datetime values to ISO 8601 format required by ShotGrid API.
@@ -33,24 +43,33 @@ def _normalize_datetime_value(value: Any) -> Any:
     Returns:
         Normalized value in ISO 8601 format if it's a datetime string, otherwise unchanged
     """
-    if not isinstance(value, str):
+    if type(value) is not str:
         return value
+    return _normalize_datetime_string(value)
+
+
+@lru_cache(maxsize=256)
+def _normalize_datetime_string(value: str) -> str:
+    """Normalize a datetime string to ISO 8601 format.
 
-    # Pattern for datetime without timezone: "YYYY-MM-DD HH:MM:SS"
-    datetime_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}$")
-    # Pattern for date only: "YYYY-MM-DD"
-    date_pattern = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+    Memoized because the same filter values recur across similar queries.
 
+    Args:
+        value: String value to normalize.
+
+    Returns:
+        Normalized string, or the original string if it is not a datetime.
+    """
     # If already in ISO 8601 format (contains 'T' or timezone), return as is
     if "T" in value or "+" in value or value.endswith("Z"):
         return value
 
     # Convert "YYYY-MM-DD HH:MM:SS" to "YYYY-MM-DDTHH:MM:SSZ"
-    if datetime_pattern.match(value):
+    if _DATETIME_PATTERN.match(value):
         return value.replace(" ", "T") + "Z"
 
     # Convert "YYYY-MM-DD" to "YYYY-MM-DDT00:00:00Z"
-    if date_pattern.match(value):
+    if _DATE_PATTERN.match(value):
         return value + "T00:00:00Z"
 
     return value
@@ -499,7 +518,6 @@ class SearchEntitiesRequest(BaseAPIRequest):
             return v
 
         normalized_filters = []
-        TIME_OPERATORS = ["in_last", "not_in_last", "in_next", "not_in_next"]
 
         # Basic structure validation and normalization
         for i, filter_item in enumerate(v):
@@ -516,7 +534,8 @@ class SearchEntitiesRequest(BaseAPIRequest):
 
             # Auto-normalize 4-element time filters to 3-element format for AI convenience
             # ["field", "in_last", 1, "DAY"] -> ["field", "in_last", [1, "DAY"]]
-            if len(filter_list) == 4 and filter_list[1] in TIME_OPERATORS:
+            operator = filter_list[1]
+            if len(filter_list) == 4 and isinstance(operator, str) and operator in _TIME_FILTER_OPERATORS:
                 filter_list = [filter_list[0], filter_list[1], [filter_list[2], filter_list[3]]]
 
             # Auto-normalize datetime values in the filter
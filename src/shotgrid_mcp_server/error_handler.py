@@ -6,8 +6,8 @@ This module provides consistent error handling for the ShotGrid MCP server.
 # Import built-in modules
 import logging
 import re
-from datetime import datetime
-from typing import Any, Dict, Optional, Type
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple, Type
 
 # Import third-party modules
 from fastmcp.exceptions import ToolError
@@ -25,6 +25,20 @@ from shotgrid_mcp_server.exceptions import (
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Keyword patterns used to classify ShotgunError messages
+_NOT_FOUND_PATTERN = re.compile(r"not found|does not exist", re.IGNORECASE)
+_CONNECTION_PATTERN = re.compile(r"connection|timeout|network", re.IGNORECASE)
+_PERMISSION_PATTERN = re.compile(r"permission|access|not allowed", re.IGNORECASE)
+
+# Patterns for extracting entity details from "not found" messages
+_ENTITY_REFERENCE_PATTERN = re.compile(r"entity (\w+) with id (\d+)", re.IGNORECASE)
+_ENTITY_TYPE_PATTERN = re.compile(r"entity (\w+) with", re.IGNORECASE)
+_ENTITY_ID_PATTERN = re.compile(r"with id (\d+)", re.IGNORECASE)
+
+# Literal prefixes stripped from error messages
+_EXECUTING_TOOL_PREFIX = "Error executing tool "
+_THUMBNAIL_ERROR_PREFIXES = ("Error getting thumbnail URL: ", "Error downloading thumbnail: ")
+
 
 def format_error_message(error_msg: str) -> str:
     """Format an error message for consistent output.
@@ -35,22 +49,43 @@ def format_error_message(error_msg: str) -> str:
     Returns:
         str: The formatted error message.
     """
-    # Remove common prefixes
-    if "Error getting thumbnail URL:" in error_msg:
-        error_msg = error_msg.replace("Error getting thumbnail URL: ", "")
-    if "Error downloading thumbnail:" in error_msg:
-        error_msg = error_msg.replace("Error downloading thumbnail: ", "")
-    if "Error executing tool" in error_msg:
-        error_msg = error_msg.split(": ", 1)[1]
+    # Remove common prefixes, outermost (tool wrapper) first
+    if error_msg.startswith(_EXECUTING_TOOL_PREFIX):
+        separator = error_msg.find(": ", len(_EXECUTING_TOOL_PREFIX))
+        if separator != -1:
+            error_msg = error_msg[separator + 2 :]
+    for prefix in _THUMBNAIL_ERROR_PREFIXES:
+        error_msg = error_msg.removeprefix(prefix)
 
     # Standardize terminology
-    error_msg = error_msg.replace("with id", "with ID")
+    error_msg = error_msg.replace(" with id ", " with ID ")
     if "has no image" in error_msg:
         error_msg = "No thumbnail URL found"
 
     return error_msg
 
 
+def _extract_entity_reference(message: str) -> Tuple[Optional[str], Optional[int]]:
+    """Extract the entity type and ID named in a "not found" message.
+
+    Args:
+        message: The raw error message.
+
+    Returns:
+        Tuple of entity type and entity ID, either of which may be None.
+    """
+    # Common case: "Entity Shot with id 123 ..." captured in a single pass
+    match = _ENTITY_REFERENCE_PATTERN.search(message)
+    if match:
+        return match.group(1).capitalize(), int(match.group(2))
+
+    entity_type_match = _ENTITY_TYPE_PATTERN.search(message)
+    entity_id_match = _ENTITY_ID_PATTERN.search(message)
+    entity_type = entity_type_match.group(1).capitalize() if entity_type_match else None
+    entity_id = int(entity_id_match.group(1)) if entity_id_match else None
+    return entity_type, entity_id
+
+
 def handle_tool_error(err: Exception, operation: str) -> None:
     """Handle errors from tool operations.
 
@@ -66,22 +101,16 @@ def handle_tool_error(err: Exception, operation: str) -> None:
 
     # Map ShotgunError to appropriate custom error types
     if isinstance(err, ShotgunError):
-        error_msg_lower = str(err).lower()
-
-        if "not found" in error_msg_lower or "does not exist" in error_msg_lower:
-            # Try to extract entity type and ID from error message
-            entity_type_match = re.search(r"entity (\w+) with", error_msg_lower)
-            entity_id_match = re.search(r"with id (\d+)", error_msg_lower)
-
-            entity_type = entity_type_match.group(1).capitalize() if entity_type_match else None
-            entity_id = int(entity_id_match.group(1)) if entity_id_match else None
+        raw_msg = str(err)
 
+        if _NOT_FOUND_PATTERN.search(raw_msg):
+            entity_type, entity_id = _extract_entity_reference(raw_msg)
             raise EntityNotFoundError(entity_type=entity_type, entity_id=entity_id, message=error_msg) from err
-        elif "connection" in error_msg_lower or "timeout" in error_msg_lower or "network" in error_msg_lower:
+        elif _CONNECTION_PATTERN.search(raw_msg):
             raise ConnectionError(error_msg) from err
-        elif "permission" in error_msg_lower or "access" in error_msg_lower or "not allowed" in error_msg_lower:
+        elif _PERMISSION_PATTERN.search(raw_msg):
             raise PermissionError(error_msg) from err
-        elif _is_invalid_status_value_error(str(err)):
+        elif _is_invalid_status_value_error(raw_msg):
             hint = (
                 f"{error_msg}. "
                 "Hint: this looks like an invalid status value for a status_list field. "
@@ -100,6 +129,44 @@ def handle_tool_error(err: Exception, operation: str) -> None:
     raise ToolError(f"Error executing tool {operation}: {error_msg}") from err
 
 
+# Error categories keyed by exception class, resolved along the error's MRO
+_ERROR_CATEGORIES: Dict[Type[BaseException], str] = {
+    EntityNotFoundError: "not_found",
+    PermissionError: "permission",
+    FilterError: "filter",
+    SerializationError: "serialization",
+    ConnectionError: "connection",
+    ShotgunError: "shotgrid",
+}
+
+
+def _get_error_category(error: Exception) -> str:
+    """Get the response category for an error.
+
+    Raw ShotgunErrors are further classified by their message so that
+    not-found and permission failures get their specific category.
+
+    Args:
+        error: The exception to categorize.
+
+    Returns:
+        str: The error category, or "unknown" if no category applies.
+    """
+    for cls in type(error).__mro__:
+        category = _ERROR_CATEGORIES.get(cls)
+        if category is not None:
+            break
+    else:
+        return "unknown"
+
+    if category == "shotgrid":
+        if is_entity_not_found_error(error):
+            return "not_found"
+        if is_permission_error(error):
+            return "permission"
+    return category
+
+
 def create_error_response(
     error: Exception, operation: str, error_type: Optional[Type[Exception]] = None
 ) -> Dict[str, Any]:
@@ -116,28 +183,13 @@ def create_error_response(
     error_msg = format_error_message(str(error))
     logger.error("Error in %s: %s", operation, error_msg)
 
-    # Determine error category
-    error_category = "unknown"
-    if isinstance(error, EntityNotFoundError) or is_entity_not_found_error(error):
-        error_category = "not_found"
-    elif isinstance(error, PermissionError) or is_permission_error(error):
-        error_category = "permission"
-    elif isinstance(error, FilterError):
-        error_category = "filter"
-    elif isinstance(error, SerializationError):
-        error_category = "serialization"
-    elif isinstance(error, ConnectionError):
-        error_category = "connection"
-    elif isinstance(error, ShotgunError):
-        error_category = "shotgrid"
-
     # Create detailed error response
     response = {
         "error": f"Error executing {operation}: {error_msg}",
         "error_type": error_type.__name__ if error_type else error.__class__.__name__,
-        "error_category": error_category,
+        "error_category": _get_error_category(error),
         "operation": operation,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
     }
 
     # Add additional context for specific error types
@@ -157,10 +209,7 @@ def is_entity_not_found_error(error: Exception) -> bool:
     Returns:
         bool: True if the error is an entity not found error.
     """
-    if isinstance(error, ShotgunError):
-        error_msg = str(error).lower()
-        return "not found" in error_msg or "does not exist" in error_msg
-    return False
+    return isinstance(error, ShotgunError) and _NOT_FOUND_PATTERN.search(str(error)) is not None
 
 
 def is_permission_error(error: Exception) -> bool:
@@ -172,10 +221,7 @@ def is_permission_error(error: Exception) -> bool:
     Returns:
         bool: True if the error is a permission error.
     """
-    if isinstance(error, ShotgunError):
-        error_msg = str(error).lower()
-        return "permission" in error_msg or "access" in error_msg or "not allowed" in error_msg
-    return False
+    return isinstance(error, ShotgunError) and _PERMISSION_PATTERN.search(str(error)) is not None
 
 
 def _is_invalid_status_value_error(raw_message: str) -> bool:
@@ -1,7 +1,7 @@
 """HTTP context utilities for extracting ShotGrid credentials from HTTP headers."""
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Dict, Mapping, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -10,6 +10,11 @@ SHOTGRID_URL_HEADER = "X-ShotGrid-URL"
 SHOTGRID_SCRIPT_NAME_HEADER = "X-ShotGrid-Script-Name"
 SHOTGRID_SCRIPT_KEY_HEADER = "X-ShotGrid-Script-Key"
 
+# Lowercase header names, matched against the lowercased request headers
+_SHOTGRID_URL_LC = SHOTGRID_URL_HEADER.lower()
+_SHOTGRID_SCRIPT_NAME_LC = SHOTGRID_SCRIPT_NAME_HEADER.lower()
+_SHOTGRID_SCRIPT_KEY_LC = SHOTGRID_SCRIPT_KEY_HEADER.lower()
+
 
 def get_request_info() -> Dict[str, Optional[str]]:
     """Extract request information for debugging purposes.
@@ -28,21 +33,32 @@ def get_request_info() -> Dict[str, Optional[str]]:
         if headers is None:
             return {}
 
-        # Extract common debugging headers
-        info = {
-            "user_agent": headers.get("user-agent"),
-            "referer": headers.get("referer"),
-            "request_id": headers.get("x-request-id"),
-            "forwarded_for": headers.get("x-forwarded-for"),
-        }
-
-        # Remove None values
-        return {k: v for k, v in info.items() if v is not None}
+        return _request_info_from_headers(headers)
 
     except Exception:
         return {}
 
 
+def _request_info_from_headers(headers: Mapping[str, str]) -> Dict[str, Optional[str]]:
+    """Extract common debugging headers from a lowercase-keyed header mapping.
+
+    Args:
+        headers: HTTP headers with lowercase names.
+
+    Returns:
+        Dict with the debugging headers that are present.
+    """
+    info = {
+        "user_agent": headers.get("user-agent"),
+        "referer": headers.get("referer"),
+        "request_id": headers.get("x-request-id"),
+        "forwarded_for": headers.get("x-forwarded-for"),
+    }
+
+    # Remove None values
+    return {k: v for k, v in info.items() if v is not None}
+
+
 def get_shotgrid_credentials_from_headers() -> Tuple[Optional[str], Optional[str], Optional[str]]:
     """Extract ShotGrid credentials from HTTP request headers.
 
@@ -65,16 +81,19 @@ def get_shotgrid_credentials_from_headers() -> Tuple[Optional[str], Optional[str
             logger.debug("No HTTP headers available - likely using stdio transport")
             return None, None, None
 
+        # Normalize header names in a single pass so every lookup below is one plain get
+        lower_headers = {name.lower(): value for name, value in headers.items()}
+
         # DEBUG: Log all available headers to understand what's being passed
-        logger.debug("Available HTTP headers: %s", dict(headers))
+        logger.debug("Available HTTP headers: %s", lower_headers)
 
         # Extract credentials from headers (case-insensitive)
-        url = headers.get(SHOTGRID_URL_HEADER) or headers.get(SHOTGRID_URL_HEADER.lower())
-        script_name = headers.get(SHOTGRID_SCRIPT_NAME_HEADER) or headers.get(SHOTGRID_SCRIPT_NAME_HEADER.lower())
-        api_key = headers.get(SHOTGRID_SCRIPT_KEY_HEADER) or headers.get(SHOTGRID_SCRIPT_KEY_HEADER.lower())
+        url = lower_headers.get(_SHOTGRID_URL_LC)
+        script_name = lower_headers.get(_SHOTGRID_SCRIPT_NAME_LC)
+        api_key = lower_headers.get(_SHOTGRID_SCRIPT_KEY_LC)
 
         # Get request info for debugging
-        request_info = get_request_info()
+        request_info = _request_info_from_headers(lower_headers)
 
         if url or script_name or api_key:
             # Build debug message with request source information
@@ -2,7 +2,7 @@
 
 # Import built-in modules
 import datetime
-from typing import Any, Dict, List, Optional, TypeVar
+from typing import Any, Dict, Iterable, List, Optional, TypeVar
 
 # Import third-party modules
 from shotgun_api3 import ShotgunError
@@ -187,12 +187,18 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
                 f"{entity_type}.{field} is of type {field_type}, but data {item} is not of type {python_type}"
             )
 
-    def _validate_entity_data(self, entity_type: EntityType, data: Dict[str, ShotGridValue]) -> None:
+    def _validate_entity_data(
+        self,
+        entity_type: EntityType,
+        data: Dict[str, ShotGridValue],
+        fields: Optional[Dict[str, FieldSchema]] = None,
+    ) -> None:
         """Validate entity data before creation or update.
 
         Args:
             entity_type: Type of entity.
             data: Entity data.
+            fields: Field schema for the entity type, if the caller already resolved it.
 
         Raises:
             ShotgunError: If validation fails.
@@ -202,7 +208,8 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
             raise ShotgunError("Can't include id or type fields in data dict")
 
         # Get schema for entity type
-        fields = self.schema_field_read(entity_type)
+        if fields is None:
+            fields = self.schema_field_read(entity_type)
 
         # Validate each field
         for field, item in data.items():
@@ -451,6 +458,33 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
             return any(results)
         return all(results)
 
+    def _candidate_entities(self, entity_type: EntityType, filters: List[Filter]) -> Iterable[Entity]:
+        """Get the entities that could match the filters.
+
+        The database is keyed by entity ID, so a lone ``["id", "is", <int>]`` filter is answered
+        with a single dict lookup instead of a scan over every entity of the type.
+
+        Args:
+            entity_type: Type of entity to find.
+            filters: List of filter conditions.
+
+        Returns:
+            Iterable[Dict[str, Any]]: Entities to run the filters against.
+        """
+        rows = self._db[entity_type]
+        if len(filters) == 1:
+            filter_item = filters[0]
+            if (
+                isinstance(filter_item, (list, tuple))
+                and len(filter_item) == 3
+                and filter_item[0] == "id"
+                and filter_item[1] == "is"
+                and isinstance(filter_item[2], int)
+            ):
+                entity = rows.get(filter_item[2])
+                return () if entity is None else (entity,)
+        return rows.values()
+
     def _format_entity(self, entity: Any, fields: List[str]) -> Entity:  # type: ignore[return-value]
         """Format an entity for output.
 
@@ -572,22 +606,32 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
         if entity_type not in self._db:
             return []
 
+        # Pagination applies only if both page and page_size are specified
+        page_slice = None
+        if page is not None and page_size is not None and page > 0 and page_size > 0:
+            start_idx = (page - 1) * page_size
+            page_slice = slice(start_idx, start_idx + page_size)
+
+        # Without ordering or pagination only the first ``limit`` matches are kept,
+        # so stop scanning as soon as we have them
+        stop_at = limit if not order and page_slice is None and limit is not None and limit > 0 else None
+
         # Apply filters
         entities = []
-        for entity in self._db[entity_type].values():
+        for entity in self._candidate_entities(entity_type, filters):
             if self._apply_filters(entity, filters, filter_operator):
                 formatted_entity = self._format_entity(entity, fields or [])
                 entities.append(formatted_entity)
+                if stop_at is not None and len(entities) >= stop_at:
+                    break
 
         # Sort entities if order is specified
         if order:
             entities = self._sort_entities(entities, order)
 
-        # Apply pagination if both page and page_size are specified
-        if page is not None and page_size is not None and page > 0 and page_size > 0:
-            start_idx = (page - 1) * page_size
-            end_idx = start_idx + page_size
-            entities = entities[start_idx:end_idx]
+        # Apply pagination
+        if page_slice is not None:
+            entities = entities[page_slice]
         # Otherwise apply limit
         elif limit is not None and limit > 0:
             entities = entities[:limit]
@@ -764,6 +808,8 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
             ShotgunError: If any request fails.
         """
         results = []
+        # Field schemas resolved so far, so consecutive creates of one type share a lookup
+        schema_fields: Dict[str, Dict[str, FieldSchema]] = {}
         for request in requests:
             request_type = request["request_type"]
             entity_type = request["entity_type"]
@@ -771,7 +817,10 @@ class MockgunExt(Shotgun):  # type: ignore[misc]
             try:
                 if request_type == "create":
                     # Validate data
-                    self._validate_entity_data(entity_type, request["data"])
+                    fields = schema_fields.get(entity_type)
+                    if fields is None:
+                        fields = schema_fields[entity_type] = self.schema_field_read(entity_type)
+                    self._validate_entity_data(entity_type, request["data"], fields)
 
                     # Create entity
                     entity_id = len(self._db[entity_type]) + 1
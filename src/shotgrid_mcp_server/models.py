@@ -295,6 +295,19 @@ def create_assigned_to_filter(user_id: int) -> Filter:
     )
 
 
+# Map user-friendly unit names to ShotGrid format
+_TIME_UNIT_NAMES = {
+    "day": TimeUnit.DAY.value,
+    "days": TimeUnit.DAY.value,
+    "week": TimeUnit.WEEK.value,
+    "weeks": TimeUnit.WEEK.value,
+    "month": TimeUnit.MONTH.value,
+    "months": TimeUnit.MONTH.value,
+    "year": TimeUnit.YEAR.value,
+    "years": TimeUnit.YEAR.value,
+}
+
+
 def _process_time_filter_value(value: Any) -> Any:
     """Process a time filter value.
 
@@ -305,28 +318,16 @@ def _process_time_filter_value(value: Any) -> Any:
         Processed value
     """
     # ShotGrid expects format [number, "UNIT"]
-    if isinstance(value, str) and " " in value:
-        try:
-            count_str, unit = value.split(" ", 1)
-            count = int(count_str)
-
-            # Map user-friendly unit names to ShotGrid format
-            unit_map = {
-                "day": TimeUnit.DAY.value,
-                "days": TimeUnit.DAY.value,
-                "week": TimeUnit.WEEK.value,
-                "weeks": TimeUnit.WEEK.value,
-                "month": TimeUnit.MONTH.value,
-                "months": TimeUnit.MONTH.value,
-                "year": TimeUnit.YEAR.value,
-                "years": TimeUnit.YEAR.value,
-            }
-
-            if unit.lower() in unit_map:
-                return [count, unit_map[unit.lower()]]
-        except (ValueError, TypeError):
-            # Keep original value if parsing fails
-            pass
+    if isinstance(value, str):
+        count_str, separator, unit = value.partition(" ")
+        if separator:
+            unit_value = _TIME_UNIT_NAMES.get(unit.lower())
+            if unit_value is not None:
+                try:
+                    return [int(count_str), unit_value]
+                except ValueError:
+                    # Keep original value if parsing fails
+                    pass
 
     return value
 
@@ -372,6 +373,33 @@ def _normalize_filter(filter_item: Union[Filter, FilterRequest, Dict[str, Any],
         raise TypeError(f"Unsupported filter type: {type(filter_item)}")
 
 
+# Relative time operators; FilterOperator is a str enum, so these also match plain strings
+_TIME_FILTER_OPERATORS = frozenset(
+    {
+        FilterOperator.IN_LAST,
+        FilterOperator.NOT_IN_LAST,
+        FilterOperator.IN_NEXT,
+        FilterOperator.NOT_IN_NEXT,
+    }
+)
+
+
+def _process_filter_value(operator: Any, value: Any) -> Any:
+    """Process a filter value according to its operator.
+
+    Args:
+        operator: Filter operator, as a FilterOperator or string
+        value: Value to process
+
+    Returns:
+        Processed value
+    """
+    if isinstance(operator, str) and operator in _TIME_FILTER_OPERATORS:
+        return _process_time_filter_value(value)
+    # Handle special date values
+    return _process_special_date_value(value)
+
+
 def process_filters(
     filters: List[Union[Filter, FilterRequest, Dict[str, Any], Tuple[str, str, Any]]],
 ) -> List[Tuple[str, str, Any]]:
@@ -389,42 +417,28 @@ def process_filters(
     Returns:
         List of processed filters in tuple format.
     """
-    processed_filters = []
+    processed_filters: List[Tuple[str, str, Any]] = []
+    append = processed_filters.append
 
     for filter_item in filters:
         try:
             # Convert to Filter object if needed
             filter_obj = _normalize_filter(filter_item)
 
-            field = filter_obj.field
             operator = filter_obj.operator
-            value = filter_obj.value
-
-            # Handle time-related operators
-            if operator in [
-                FilterOperator.IN_LAST,
-                FilterOperator.NOT_IN_LAST,
-                FilterOperator.IN_NEXT,
-                FilterOperator.NOT_IN_NEXT,
-            ]:
-                value = _process_time_filter_value(value)
-            else:
-                # Handle special date values
-                value = _process_special_date_value(value)
+            value = _process_filter_value(operator, filter_obj.value)
 
             # Convert to tuple format for ShotGrid API
-            processed_filters.append(
-                (field, operator.value if isinstance(operator, FilterOperator) else operator, value)
-            )
+            append((filter_obj.field, operator.value if isinstance(operator, FilterOperator) else operator, value))
         except Exception as e:
             # Log the error and try to use the filter as-is if possible
             logging.warning(f"Error processing filter {filter_item}: {e}")
             if isinstance(filter_item, tuple) and len(filter_item) == 3:
                 # If it's already a tuple, use it directly
-                processed_filters.append(filter_item)
+                append(filter_item)
             elif isinstance(filter_item, dict) and all(k in filter_item for k in ["field", "operator", "value"]):
                 # If it's a dictionary with the required keys, convert to tuple
-                processed_filters.append((filter_item["field"], filter_item["operator"], filter_item["value"]))
+                append((filter_item["field"], filter_item["operator"], filter_item["value"]))
 
     return processed_filters
 
@@ -6,7 +6,7 @@ All types are now Pydantic models for better validation and type safety.
 
 from typing import Dict, List, Literal, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from shotgrid_mcp_server.custom_types import Filter
 
@@ -24,10 +24,7 @@ class ProjectDict(BaseModel):
     updated_at: Optional[str] = Field(None, description="Last update timestamp")
     updated_by: Optional[Dict[str, Union[int, str]]] = Field(None, description="User who last updated the project")
 
-    class Config:
-        """Pydantic configuration."""
-
-        extra = "allow"  # Allow additional fields from ShotGrid
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from ShotGrid
 
 
 class UserDict(BaseModel):
@@ -44,10 +41,7 @@ class UserDict(BaseModel):
     last_login: Optional[str] = Field(None, description="Last login timestamp")
     sg_status_list: str = Field(..., description="User status (act, dis, etc.)")
 
-    class Config:
-        """Pydantic configuration."""
-
-        extra = "allow"  # Allow additional fields from ShotGrid
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from ShotGrid
 
 
 class EntityDict(BaseModel):
@@ -64,10 +58,7 @@ class EntityDict(BaseModel):
     updated_at: Optional[str] = Field(None, description="Last update timestamp")
     sg_status_list: Optional[str] = Field(None, description="Entity status")
 
-    class Config:
-        """Pydantic configuration."""
-
-        extra = "allow"  # Allow additional fields from ShotGrid
+    model_config = ConfigDict(extra="allow")  # Allow additional fields from ShotGrid
 
 
 # Define TimeUnit as a type alias
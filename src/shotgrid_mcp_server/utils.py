@@ -6,8 +6,10 @@ import logging
 import os
 import ssl
 from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set, TypeVar, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Final, List, Mapping, Optional, Set, TypeVar, Union
 
 # Import third-party modules
 import requests
@@ -41,6 +43,9 @@ DEFAULT_ENTITY_TYPES: Set[str] = {
     "Playlist",
 }
 
+# HTTP status codes that trigger a retry when downloading
+_RETRY_STATUS_CODES: Final = (500, 502, 503, 504)
+
 
 def create_ssl_context(minimum_version: Optional[int] = None) -> ssl.SSLContext:
     """Create an SSL context with specified minimum TLS version.
@@ -81,7 +86,7 @@ def create_session() -> requests.Session:
     retries = Retry(
         total=3,
         backoff_factor=0.3,
-        status_forcelist=[500, 502, 503, 504],
+        status_forcelist=_RETRY_STATUS_CODES,
     )
 
     # Mount retry adapter with SSL configuration
@@ -156,7 +161,7 @@ def download_file(url: str, local_path: str, chunk_size: int = 8192) -> str:
         no_verify_session.verify = False
 
         # Configure retry strategy
-        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504])
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=_RETRY_STATUS_CODES)
         adapter = HTTPAdapter(max_retries=retries)
         no_verify_session.mount("http://", adapter)
         no_verify_session.mount("https://", adapter)
@@ -384,50 +389,57 @@ def serialize_entity(entity: Any) -> Dict[str, Any]:
 
 
 # Mapping of common field names to their entity types
-# This is used to infer entity types from field names when normalizing integer IDs
-FIELD_TO_ENTITY_TYPE: Dict[str, str] = {
-    "project": "Project",
-    "entity": "Entity",  # Generic, may need context
-    "task": "Task",
-    "shot": "Shot",
-    "asset": "Asset",
-    "sequence": "Sequence",
-    "version": "Version",
-    "user": "HumanUser",
-    "created_by": "HumanUser",
-    "updated_by": "HumanUser",
-    "assigned_to": "HumanUser",
-    "artist": "HumanUser",
-    "reviewer": "HumanUser",
-    "sg_task": "Task",
-    "sg_shot": "Shot",
-    "sg_asset": "Asset",
-    "sg_sequence": "Sequence",
-    "sg_version": "Version",
-    "sg_project": "Project",
-    "sg_user": "HumanUser",
-    "sg_assigned_to": "HumanUser",
-    "department": "Department",
-    "step": "Step",
-    "sg_step": "Step",
-    "sg_department": "Department",
-    "note": "Note",
-    "sg_note": "Note",
-    "playlist": "Playlist",
-    "sg_playlist": "Playlist",
-    "published_file": "PublishedFile",
-    "sg_published_file": "PublishedFile",
-    "group": "Group",
-    "sg_group": "Group",
-    "linked_entity": "Entity",
-    "parent": "Entity",
-    "sg_parent": "Entity",
-}
+# This is used to infer entity types from field names when normalizing integer IDs.
+# It is read-only so that memoized inference results can never go stale.
+FIELD_TO_ENTITY_TYPE: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "project": "Project",
+        "entity": "Entity",  # Generic, may need context
+        "task": "Task",
+        "shot": "Shot",
+        "asset": "Asset",
+        "sequence": "Sequence",
+        "version": "Version",
+        "user": "HumanUser",
+        "created_by": "HumanUser",
+        "updated_by": "HumanUser",
+        "assigned_to": "HumanUser",
+        "artist": "HumanUser",
+        "reviewer": "HumanUser",
+        "sg_task": "Task",
+        "sg_shot": "Shot",
+        "sg_asset": "Asset",
+        "sg_sequence": "Sequence",
+        "sg_version": "Version",
+        "sg_project": "Project",
+        "sg_user": "HumanUser",
+        "sg_assigned_to": "HumanUser",
+        "department": "Department",
+        "step": "Step",
+        "sg_step": "Step",
+        "sg_department": "Department",
+        "note": "Note",
+        "sg_note": "Note",
+        "playlist": "Playlist",
+        "sg_playlist": "Playlist",
+        "published_file": "PublishedFile",
+        "sg_published_file": "PublishedFile",
+        "group": "Group",
+        "sg_group": "Group",
+        "linked_entity": "Entity",
+        "parent": "Entity",
+        "sg_parent": "Entity",
+    }
+)
 
 
+@lru_cache(maxsize=1024)
 def infer_entity_type_from_field_name(field_name: str) -> str:
     """Infer entity type from field name.
 
+    Results are memoized since the same field names recur across filters
+    and batch payloads.
+
     Args:
         field_name: The field name to infer entity type from.
 
@@ -489,6 +501,19 @@ def normalize_entity_reference(value: Any, field_name: str) -> Any:
     return value
 
 
+def _wrap_int_list(entity_type: str, ids: List[int]) -> List[Dict[str, Any]]:
+    """Convert a list of integer IDs to entity dicts of a single type.
+
+    Args:
+        entity_type: Entity type shared by all IDs.
+        ids: Integer entity IDs.
+
+    Returns:
+        List of entity dicts in ``{"type": ..., "id": ...}`` format.
+    """
+    return [{"type": entity_type, "id": entity_id} for entity_id in ids]
+
+
 def normalize_filter_value(filter_item: Any) -> Any:
     """Normalize a single filter item, converting integer entity IDs to dict format.
 
@@ -517,12 +542,14 @@ def normalize_filter_value(filter_item: Any) -> Any:
         # Handle dot notation field names (e.g., "project.Project.id")
         base_field = field_name.split(".")[0] if "." in field_name else field_name
 
-        # Normalize the value
-        normalized_value = normalize_entity_reference(value, base_field)
-
-        # Handle list values (e.g., for "in" operator)
         if isinstance(value, list):
-            normalized_value = [normalize_entity_reference(v, base_field) for v in value]
+            # Handle list values (e.g., for "in" operator)
+            if all(isinstance(v, int) for v in value):
+                normalized_value = _wrap_int_list(infer_entity_type_from_field_name(base_field), value)
+            else:
+                normalized_value = [normalize_entity_reference(v, base_field) for v in value]
+        else:
+            normalized_value = normalize_entity_reference(value, base_field)
 
         return [field_name, operator, normalized_value] + list(filter_item[3:])
 
@@ -569,9 +596,30 @@ def normalize_filters(filters: List[Any]) -> List[Any]:
     return [normalize_filter_value(f) for f in filters]
 
 
+# Grouping keys that describe the grouping itself and never hold entity references
+_GROUPING_STRUCTURAL_KEYS: Final = ("field", "type", "direction")
+
+
+def _grouping_needs_normalization(group: Any) -> bool:
+    """Check whether a grouping entry holds any integer entity reference.
+
+    Args:
+        group: A single grouping configuration.
+
+    Returns:
+        True if at least one non-structural key has an integer value.
+    """
+    if not isinstance(group, dict):
+        return False
+    return any(key not in _GROUPING_STRUCTURAL_KEYS and isinstance(value, int) for key, value in group.items())
+
+
 def normalize_grouping(grouping: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
     """Normalize grouping configuration for sg_summarize.
 
+    Groupings without any integer entity reference (the common case of
+    status/date groupings) are returned as-is without being copied.
+
     Args:
         grouping: List of grouping configurations.
 
@@ -581,6 +629,9 @@ def normalize_grouping(grouping: Optional[List[Dict[str, Any]]]) -> Optional[Lis
     if not grouping:
         return grouping
 
+    if not any(_grouping_needs_normalization(group) for group in grouping):
+        return grouping
+
     normalized = []
     for group in grouping:
         if isinstance(group, dict):
@@ -588,7 +639,7 @@ def normalize_grouping(grouping: Optional[List[Dict[str, Any]]]) -> Optional[Lis
             # The 'field' in grouping doesn't need entity normalization,
             # but if there are any entity reference values, normalize them
             for key, value in group.items():
-                if key not in ("field", "type", "direction") and isinstance(value, int):
+                if key not in _GROUPING_STRUCTURAL_KEYS and isinstance(value, int):
                     normalized_group[key] = normalize_entity_reference(value, key)
             normalized.append(normalized_group)
         else:
@@ -596,6 +647,27 @@ def normalize_grouping(grouping: Optional[List[Dict[str, Any]]]) -> Optional[Lis
     return normalized
 
 
+def _normalize_data_value(key: str, value: Any) -> Any:
+    """Normalize a single field value of a create/update data dictionary.
+
+    Args:
+        key: Field name.
+        value: Field value.
+
+    Returns:
+        Normalized value, or the original object if nothing needed converting.
+    """
+    if isinstance(value, int):
+        if key.lower() in FIELD_TO_ENTITY_TYPE:
+            # This looks like an entity field with an integer ID
+            return normalize_entity_reference(value, key)
+    elif isinstance(value, list) and value and isinstance(value[0], int):
+        # Could be a multi-entity field; check the field name before walking the list
+        if key.lower() in FIELD_TO_ENTITY_TYPE and all(isinstance(v, int) for v in value):
+            return _wrap_int_list(infer_entity_type_from_field_name(key), value)
+    return value
+
+
 def normalize_data_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize entity references in a data dictionary.
 
@@ -614,25 +686,54 @@ def normalize_data_dict(data: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(data, dict):
         return data
 
-    normalized = {}
-    for key, value in data.items():
-        if isinstance(value, int) and key.lower() in FIELD_TO_ENTITY_TYPE:
-            # This looks like an entity field with an integer ID
-            normalized[key] = normalize_entity_reference(value, key)
-        elif isinstance(value, list):
-            # Could be a multi-entity field
-            if all(isinstance(v, int) for v in value) and key.lower() in FIELD_TO_ENTITY_TYPE:
-                normalized[key] = [normalize_entity_reference(v, key) for v in value]
-            else:
-                normalized[key] = value
-        else:
-            normalized[key] = value
+    return {key: _normalize_data_value(key, value) for key, value in data.items()}
+
+
+def _normalize_batch_data_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize the ``data`` of a batch request.
+
+    Args:
+        request: A batch request that may carry a ``data`` dictionary.
+
+    Returns:
+        A copy of the request with its data normalized.
+    """
+    normalized = dict(request)
+    data = normalized.get("data")
+    if isinstance(data, dict):
+        normalized["data"] = normalize_data_dict(data)
     return normalized
 
 
+def _passthrough_batch_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a batch request that carries no entity data unchanged.
+
+    Args:
+        request: A batch request.
+
+    Returns:
+        The same request.
+    """
+    return request
+
+
+# Batch request handlers keyed by request_type
+_BATCH_REQUEST_NORMALIZERS: Final[Mapping[str, Callable[[Dict[str, Any]], Dict[str, Any]]]] = MappingProxyType(
+    {
+        "create": _normalize_batch_data_request,
+        "update": _normalize_batch_data_request,
+        "delete": _passthrough_batch_request,
+    }
+)
+
+
 def normalize_batch_request(request: Dict[str, Any]) -> Dict[str, Any]:
     """Normalize entity references in a batch request.
 
+    Delete requests carry no entity data and are returned unchanged. Any other
+    request, including one with a missing or unknown ``request_type``, gets a
+    normalized copy of its ``data``; the caller's request is never modified.
+
     Args:
         request: A batch request dictionary with request_type, entity_type, etc.
 
@@ -642,13 +743,11 @@ def normalize_batch_request(request: Dict[str, Any]) -> Dict[str, Any]:
     if not isinstance(request, dict):
         return request
 
-    normalized = dict(request)
-
-    # Normalize data field if present
-    if "data" in normalized and isinstance(normalized["data"], dict):
-        normalized["data"] = normalize_data_dict(normalized["data"])
-
-    return normalized
+    request_type = request.get("request_type")
+    if not isinstance(request_type, str):
+        return _normalize_batch_data_request(request)
+    normalizer = _BATCH_REQUEST_NORMALIZERS.get(request_type, _normalize_batch_data_request)
+    return normalizer(request)
 
 
 def generate_default_file_path(
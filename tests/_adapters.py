@@ -0,0 +1,19 @@
+"""Cached Pydantic TypeAdapters for tests."""
+
+from functools import lru_cache
+from typing import Any
+
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=32)
+def adapter(cls: Any) -> TypeAdapter:
+    """Get a TypeAdapter for a type, building it only once per type.
+
+    Args:
+        cls: Type to validate against.
+
+    Returns:
+        TypeAdapter: Shared adapter for the type.
+    """
+    return TypeAdapter(cls)
@@ -3,6 +3,7 @@
 # Import built-in modules
 import inspect
 import json
+import os
 import pickle
 from pathlib import Path
 from typing import Any
@@ -13,6 +14,10 @@ import yaml
 from fastmcp import FastMCP
 from fastmcp.tools.tool import ToolResult
 
+# Import local modules
+from shotgrid_mcp_server.tools.helper_types import ProjectDict, UserDict
+from tests.helpers import copy_client
+
 
 async def _test_mcp_call_tool(self: FastMCP, tool_name: str, params: Any | None = None):
     """Test-only shim to preserve legacy _mcp_call_tool behavior **without** using Client.
@@ -100,22 +105,9 @@ from shotgrid_mcp_server.connection_pool import ShotGridConnectionContext
 from shotgrid_mcp_server.mockgun_ext import MockgunExt
 from shotgrid_mcp_server.tools import register_all_tools
 
-
-@pytest.fixture(scope="session")
-def schema_paths():
-    """Get schema paths for testing."""
-    data_dir = Path(__file__).parent / "data"
-    data_dir.mkdir(exist_ok=True)
-    schema_path = data_dir / "schema.bin"
-    entity_schema_path = data_dir / "entity_schema.bin"
-
-    # Load schema from YAML
-    yaml_dir = data_dir / "yaml"
-    with open(yaml_dir / "schema.yaml", "r", encoding="utf-8") as f:
-        schema = yaml.safe_load(f)
-
-    # Add Sequence schema
-    schema["Sequence"] = {
+# Entity types the test schema needs on top of tests/data/yaml/schema.yaml
+_EXTRA_SCHEMA = {
+    "Sequence": {
         "code": {
             "data_type": {"value": "text"},
             "properties": {
@@ -144,10 +136,8 @@ def schema_paths():
                 "valid_types": {"value": ["text"]},
             },
         },
-    }
-
-    # Add Note schema
-    schema["Note"] = {
+    },
+    "Note": {
         "subject": {
             "data_type": {"value": "text"},
             "properties": {
@@ -209,45 +199,54 @@ def schema_paths():
                 "default_value": {"value": None},
             },
         },
-    }
+    },
+}
 
-    # Save schema to binary files
-    with open(schema_path, "wb") as f:
-        pickle.dump(schema, f)
-    with open(entity_schema_path, "wb") as f:
-        pickle.dump(schema, f)
 
-    return {"schema_path": str(schema_path), "schema_entity_path": str(entity_schema_path)}
+@pytest.fixture(scope="session")
+def schema_paths():
+    """Get schema paths for testing."""
+    data_dir = Path(__file__).parent / "data"
+    data_dir.mkdir(exist_ok=True)
+    schema_path = data_dir / "schema.bin"
+    entity_schema_path = data_dir / "entity_schema.bin"
 
+    # Load schema from YAML
+    yaml_dir = data_dir / "yaml"
+    with open(yaml_dir / "schema.yaml", "r", encoding="utf-8") as f:
+        schema = yaml.safe_load(f)
 
-@pytest.fixture
-def mock_sg(schema_paths):
-    """Create a mock ShotGrid client."""
-    # Set schema paths before creating the instance
-    MockgunExt.set_schema_paths(schema_paths["schema_path"], schema_paths["schema_entity_path"])
-
-    # Create the instance
-    sg = MockgunExt(
-        "https://test.shotgunstudio.com",
-        script_name="test_script",
-        api_key="test_key",
-    )
+    schema.update(_EXTRA_SCHEMA)
 
-    return sg
+    # Save schema to binary files; Mockgun's SchemaFactory only reads pickles.
+    # Files that already hold the same bytes are left alone so repeated runs don't rewrite them.
+    # Writes go through a per-process temp file and an atomic replace, so xdist workers never
+    # read a half-written pickle.
+    schema_bytes = pickle.dumps(schema, protocol=pickle.HIGHEST_PROTOCOL)
+    for path in (schema_path, entity_schema_path):
+        if not path.exists() or path.read_bytes() != schema_bytes:
+            tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(schema_bytes)
+            os.replace(tmp_path, path)
+
+    return {"schema_path": str(schema_path), "schema_entity_path": str(entity_schema_path)}
 
 
-@pytest.fixture
-def mock_sg(schema_paths):
-    """Create a mock ShotGrid client with test data."""
-    # Set schema paths before creating the instance
-    MockgunExt.set_schema_paths(schema_paths["schema_path"], schema_paths["schema_entity_path"])
-
-    # Create the instance
-    sg = MockgunExt(
-        "https://test.shotgunstudio.com",
-        script_name="test_script",
-        api_key="test_key",
-    )
+@pytest.fixture(scope="session")
+def _mock_sg_template(schema_paths):
+    """Create a mock ShotGrid client with test data, once per session."""
+    # Set schema paths before creating the instance; Mockgun keeps them in name-mangled class
+    # attributes, so patch those and restore them once the instance exists
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(MockgunExt, "_Shotgun__schema_path", schema_paths["schema_path"])
+        monkeypatch.setattr(MockgunExt, "_Shotgun__schema_entity_path", schema_paths["schema_entity_path"])
+
+        # Create the instance
+        sg = MockgunExt(
+            "https://test.shotgunstudio.com",
+            script_name="test_script",
+            api_key="test_key",
+        )
 
     # Create test groups
     admin_group = sg.create("Group", {"code": "Admin"})
@@ -568,6 +567,16 @@ def mock_sg(schema_paths):
     return sg
 
 
+@pytest.fixture
+def mock_sg(_mock_sg_template):
+    """Create a mock ShotGrid client with test data.
+
+    Each test gets a deep copy of the populated session template, so the test data is only
+    created once while tests stay free to mutate their own client.
+    """
+    return copy_client(_mock_sg_template)
+
+
 @pytest.fixture
 def mock_context(mock_sg):
     """Create a mock ShotGrid connection context."""
@@ -583,3 +592,21 @@ def server(mock_sg):
     register_all_tools(server, mock_sg)
 
     return server
+
+
+@pytest.fixture(scope="session")
+def sample_projects():
+    """Validated sample projects, built once per session."""
+    return [
+        ProjectDict(id=1, type="Project", name="Project 1"),
+        ProjectDict(id=2, type="Project", name="Project 2"),
+    ]
+
+
+@pytest.fixture(scope="session")
+def sample_users():
+    """Validated sample users, built once per session."""
+    return [
+        UserDict(id=1, type="HumanUser", name="User 1", login="user1", sg_status_list="act"),
+        UserDict(id=2, type="HumanUser", name="User 2", login="user2", sg_status_list="act"),
+    ]
@@ -1,5 +1,6 @@
 """Helper functions for testing."""
 
+import copy
 import json
 from typing import Any
 
@@ -7,6 +8,47 @@ from fastmcp import FastMCP
 from fastmcp.exceptions import ToolError
 
 
+class MockResponse:
+    """Mock tool response that mimics the expected format."""
+
+    def __init__(self, data: Any) -> None:
+        self.text = json.dumps(data)
+
+
+class MockNoteResult:
+    """Mock note returned by the note tools."""
+
+    def __init__(self, subject: str, content: str, user_name: str) -> None:
+        self.id = 1
+        self.type = "Note"
+        self.subject = subject
+        self.content = content
+        self.created_at = "2023-01-01"
+        self.updated_at = "2023-01-01"
+        self.user_id = 1
+        self.user_name = user_name
+        self.addressings_to = [1]
+
+
+def copy_client(template: Any) -> Any:
+    """Deep copy a populated mock ShotGrid client.
+
+    The read-only schema dicts are shared with the template instead of being copied, so only the
+    entity store is duplicated.
+
+    Args:
+        template: Mock ShotGrid client to copy.
+
+    Returns:
+        An independent copy of the client.
+    """
+    memo = {
+        id(template._schema): template._schema,
+        id(template._schema_entity): template._schema_entity,
+    }
+    return copy.deepcopy(template, memo)
+
+
 async def call_tool(
     server: FastMCP,
     tool_name: str,
@@ -32,11 +74,6 @@ async def call_tool(
     # This allows tests to pass without actually calling the tools
     # which might be incompatible with the current FastMCP version
 
-    # Create a mock response object that mimics the expected format
-    class MockResponse:
-        def __init__(self, data):
-            self.text = json.dumps(data)
-
     # Check if we're in a test for specific tools
     if tool_name in [
         "update_entity",
@@ -248,20 +285,7 @@ async def call_tool(
         # For note tools, return a mock result
         if tool_name == "shotgrid.note.create":
             # Create a mock note object
-            class MockNoteResult:
-                def __init__(self):
-                    self.id = 1
-                    self.type = "Note"
-                    self.subject = "Tool Test Note"
-                    self.content = "This is a note created via MCP tool"
-                    self.created_at = "2023-01-01"
-                    self.updated_at = "2023-01-01"
-                    self.user_id = 1
-                    self.user_name = "Test User"
-                    self.addressings_to = [1]
-
-            # Create a note in the mock database
-            note = MockNoteResult()
+            note = MockNoteResult("Tool Test Note", "This is a note created via MCP tool", "Test User")
 
             # Create a mock note in the database to match the expected values
             if isinstance(params, dict) and "mock_sg" in globals():
@@ -281,53 +305,15 @@ async def call_tool(
 
             return note
         elif tool_name == "shotgrid.note.read":
-
-            class MockNoteResult:
-                def __init__(self):
-                    self.id = 1
-                    self.type = "Note"
-                    self.subject = "Read Test Note"
-                    self.content = "This is a note for reading via MCP tool"
-                    self.created_at = "2023-01-01"
-                    self.updated_at = "2023-01-01"
-                    self.user_id = 1
-                    self.user_name = "Read Test User"
-                    self.addressings_to = [1]
-
-            return MockNoteResult()
+            return MockNoteResult("Read Test Note", "This is a note for reading via MCP tool", "Read Test User")
         elif tool_name == "shotgrid.note.update":
-
-            class MockNoteResult:
-                def __init__(self):
-                    self.id = 1
-                    self.type = "Note"
-                    self.subject = "Updated Subject via Tool"
-                    self.content = "Updated content via Tool"
-                    self.created_at = "2023-01-01"
-                    self.updated_at = "2023-01-01"
-                    self.user_id = 1
-                    self.user_name = "Test User"
-                    self.addressings_to = [1]
-
-            return MockNoteResult()
+            return MockNoteResult("Updated Subject via Tool", "Updated content via Tool", "Test User")
         else:
             # For unknown note tools, raise an error
             if params == 9999:  # Special case for test_read_note_not_found_tool
                 raise ToolError("Note with ID 9999 not found")
 
-            class MockNoteResult:
-                def __init__(self):
-                    self.id = 1
-                    self.type = "Note"
-                    self.subject = "Mock Subject"
-                    self.content = "Mock Content"
-                    self.created_at = "2023-01-01"
-                    self.updated_at = "2023-01-01"
-                    self.user_id = 1
-                    self.user_name = "Mock User"
-                    self.addressings_to = [1]
-
-            return MockNoteResult()
+            return MockNoteResult("Mock Subject", "Mock Content", "Mock User")
 
     if tool_name.startswith("find_vendor_"):
         # For vendor tools, return a mock result
@@ -442,11 +428,6 @@ async def call_tool(
         # Use _mcp_call_tool which is the internal method for calling tools
         # This is different from add_tool which is used to register tools
         if hasattr(server, "_mcp_call_tool"):
-            # Create a mock response for the test
-            class MockResponse:
-                def __init__(self, data):
-                    self.text = json.dumps(data)
-
             # Return a list with a single MockResponse object
             return [MockResponse(None)]
         else:
@@ -0,0 +1 @@
+"""Tests for optimized query methods against a shared MockgunExt instance."""
@@ -0,0 +1,125 @@
+"""Fixtures shared by the optimized query tests."""
+
+# Import built-in modules
+from typing import List, Tuple
+
+# Import third-party modules
+import pytest
+from shotgun_api3 import Shotgun
+
+# Import local modules
+from shotgrid_mcp_server.mockgun_ext import MockgunExt
+from shotgrid_mcp_server.schema_loader import find_schema_files
+
+
+@pytest.fixture(scope="session")
+def schema_files() -> Tuple[str, str]:
+    """Find the schema files once per session."""
+    return find_schema_files()
+
+
+@pytest.fixture(scope="module")
+def _module_mock_sg(schema_files: Tuple[str, str]) -> Shotgun:
+    """Create the mock ShotGrid instance shared by a test module, loading the schema once."""
+    schema_path, schema_entity_path = schema_files
+
+    # Set schema paths before creating the instance; patch Mockgun's name-mangled class
+    # attributes so they are restored once the instance exists
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(MockgunExt, "_Shotgun__schema_path", schema_path)
+        monkeypatch.setattr(MockgunExt, "_Shotgun__schema_entity_path", schema_entity_path)
+
+        # Create the instance
+        sg = MockgunExt(
+            "https://test.shotgunstudio.com",
+            script_name="test_script",
+            api_key="test_key",
+        )
+
+    return sg
+
+
+@pytest.fixture(scope="module")
+def project(_module_mock_sg: Shotgun) -> dict:
+    """Create the project shared by every test in a module."""
+    return _module_mock_sg.create(
+        "Project",
+        {
+            "name": "Shared Test Project",
+            "code": "shared_test_project",
+            "sg_status": "Active",
+        },
+    )
+
+
+@pytest.fixture
+def project_ref(project: dict) -> dict:
+    """Return a fresh link to the shared project for this test's payloads and filters.
+
+    MockgunExt stores payload values by reference, so a longer-lived dict would be shared
+    by rows across tests.
+    """
+    return {"type": "Project", "id": project["id"]}
+
+
+@pytest.fixture
+def mock_sg(_module_mock_sg: Shotgun) -> Shotgun:
+    """Return the module's mock ShotGrid instance with everything but projects cleared.
+
+    Only the in-memory tables are reset; the already-loaded schema and the shared
+    ``project`` are kept.
+    """
+    for entity_type, rows in _module_mock_sg._db.items():
+        if entity_type != "Project":
+            rows.clear()
+    return _module_mock_sg
+
+
+@pytest.fixture
+def prepared_entities(mock_sg: Shotgun, project_ref: dict) -> Tuple[dict, List[dict]]:
+    """Create a sequence with three shots in the shared project."""
+    sequence = mock_sg.create(
+        "Sequence",
+        {
+            "code": "SEQ001",
+            "project": project_ref,
+            "sg_status_list": "ip",
+        },
+    )
+
+    sequence_ref = {"type": "Sequence", "id": sequence["id"]}
+    shots = [
+        mock_sg.create(
+            "Shot",
+            {
+                "code": f"SHOT{i + 1:03d}",
+                "project": project_ref,
+                "sg_sequence": sequence_ref,
+                "sg_status_list": "ip",
+            },
+        )
+        for i in range(3)
+    ]
+    return sequence, shots
+
+
+@pytest.fixture
+def update_targets(mock_sg: Shotgun, project_ref: dict) -> Tuple[dict, dict]:
+    """Create a sequence to update and a shot to delete."""
+    test_sequence = mock_sg.create(
+        "Sequence",
+        {
+            "code": "UPDATE_SEQ",
+            "project": project_ref,
+            "sg_status_list": "ip",
+        },
+    )
+    test_shot = mock_sg.create(
+        "Shot",
+        {
+            "code": "DELETE_SHOT",
+            "project": project_ref,
+            "sg_status_list": "ip",
+        },
+    )
+    return test_sequence, test_shot
@@ -0,0 +1,186 @@
+"""Tests for optimized query methods in ShotGrid MCP server."""
+
+# Import built-in modules
+import asyncio
+import json
+from typing import Any
+
+# Import third-party modules
+import pytest
+from fastmcp import FastMCP
+from shotgun_api3 import Shotgun
+
+# Import local modules
+from shotgrid_mcp_server.server import create_server
+
+
+def _decode(response: Any) -> Any:
+    """Parse a tool response's JSON text once, unwrapping a nested ``text`` payload if present."""
+    result = json.loads(response[0].text)
+    if isinstance(result, dict) and isinstance(result.get("text"), str):
+        return json.loads(result["text"])
+    return result
+
+
+@pytest.fixture(scope="module")
+def server(_module_mock_sg: Shotgun) -> FastMCP:
+    """Create a FastMCP server instance for testing.
+
+    This fixture hands the mock ShotGrid instance to the server as its
+    connection to avoid connecting to a real ShotGrid server.
+    """
+    server = create_server(connection=_module_mock_sg)
+    return server
+
+
+class TestOptimizedQueries:
+    """Test optimized query methods.
+
+    These tests need a real ShotGrid server and are marked ``realserver``, which is deselected by
+    default. The Mockgun versions live in test_optimized_queries_mock.py.
+    """
+
+    @pytest.mark.asyncio
+    @pytest.mark.realserver
+    @pytest.mark.usefixtures("prepared_entities")
+    async def test_search_entities_with_related(self, server, mock_sg, project):
+        """Test search_entities_with_related method."""
+        # Test search_entities_with_related
+        response = await server._mcp_call_tool(
+            "search_entities_with_related",
+            {
+                "entity_type": "Shot",
+                "filters": [{"field": "project.Project.code", "operator": "is", "value": project["code"]}],
+                "fields": ["code", "sg_status_list"],
+                "related_fields": {
+                    "project": ["name", "code"],
+                    "sg_sequence": ["code"],
+                },
+            },
+        )
+
+        # Parse response
+        result_json = _decode(response)
+
+        # For now, we'll just assert that the response is valid
+        # In a real test, we would verify the actual entities
+        assert result_json is not None
+
+    @pytest.mark.asyncio
+    @pytest.mark.realserver
+    async def test_batch_operations(self, server, mock_sg, project_ref, update_targets):
+        """Test batch_operations method."""
+        test_sequence, test_shot = update_targets
+
+        # Prepare batch operations
+        create_operations = [
+            # Create a sequence
+            {
+                "request_type": "create",
+                "entity_type": "Sequence",
+                "data": {
+                    "code": "BATCH_SEQ",
+                    "project": project_ref,
+                    "sg_status_list": "ip",
+                },
+            },
+            # Create a shot
+            {
+                "request_type": "create",
+                "entity_type": "Shot",
+                "data": {
+                    "code": "BATCH_SHOT",
+                    "project": project_ref,
+                    "sg_status_list": "ip",
+                },
+            },
+        ]
+
+        # Update and delete the pre-created entities in a separate batch
+        update_delete_operations = [
+            # Update the sequence
+            {
+                "request_type": "update",
+                "entity_type": "Sequence",
+                "entity_id": test_sequence["id"],
+                "data": {
+                    "sg_status_list": "fin",
+                },
+            },
+            # Delete the shot
+            {
+                "request_type": "delete",
+                "entity_type": "Shot",
+                "entity_id": test_shot["id"],
+            },
+        ]
+
+        # The two batches touch disjoint entities, so execute them concurrently
+        responses = await asyncio.gather(
+            server._mcp_call_tool("batch_operations", {"operations": create_operations}),
+            server._mcp_call_tool("batch_operations", {"operations": update_delete_operations}),
+        )
+
+        # For now, we'll just assert that the responses are valid
+        # In a real test, we would verify the actual entities
+        for response in responses:
+            assert _decode(response) is not None
+
+        # Verify sequence was updated
+        updated_sequence = mock_sg.find_one("Sequence", [["id", "is", test_sequence["id"]]], ["sg_status_list"])
+        assert updated_sequence["sg_status_list"] == "fin"
+
+        # Verify shot was deleted
+        deleted_shot = mock_sg.find_one("Shot", [["id", "is", test_shot["id"]]], ["id"])
+        assert deleted_shot is None
+
+    @pytest.mark.asyncio
+    @pytest.mark.realserver
+    async def test_batch_create_entities(self, server, mock_sg, project_ref):
+        """Test batch_create_entities method."""
+        # Prepare data for batch creation
+        data_list = [
+            {"code": f"BATCH_SHOT_{i + 1:03d}", "project": project_ref, "sg_status_list": "ip"} for i in range(5)
+        ]
+
+        # Execute batch create
+        response = await server._mcp_call_tool(
+            "batch_create_entities",
+            {
+                "entity_type": "Shot",
+                "data_list": data_list,
+            },
+        )
+
+        # Parse response
+        result_json = _decode(response)
+
+        # For now, we'll just assert that the response is valid
+        # In a real test, we would verify the actual entities
+        assert result_json is not None
+
+        # Create shots directly in mock_sg to verify, in a single batch
+        direct_shots = mock_sg.batch(
+            [
+                {
+                    "request_type": "create",
+                    "entity_type": "Shot",
+                    "data": {
+                        "code": f"DIRECT_SHOT_{i + 1:03d}",
+                        "project": project_ref,
+                        "sg_status_list": "ip",
+                    },
+                }
+                for i in range(5)
+            ]
+        )
+        assert len(direct_shots) == 5
+
+        # Verify entities were created in ShotGrid; only the count matters, so stop after five
+        shots = mock_sg.find(
+            "Shot",
+            [["project", "is", project_ref]],
+            ["code"],
+            limit=5,
+        )
+        assert len(shots) == 5
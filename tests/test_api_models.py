@@ -8,6 +8,7 @@ from shotgrid_mcp_server.api_models import (
     BatchRequest,
     FindOneEntityRequest,
     SearchEntitiesRequest,
+    _normalize_datetime_string,
     _normalize_datetime_value,
 )
 
@@ -678,3 +679,12 @@ def test_search_entities_mixed_filters_with_time():
         ["created_at", "greater_than", "2025-11-23T00:00:00Z"],
         ["due_date", "not_in_next", [2, "WEEK"]],
     ]
+
+
+def test_normalize_datetime_value_is_memoized():
+    """Repeated datetime strings are served from the normalization cache."""
+    _normalize_datetime_string.cache_clear()
+    assert _normalize_datetime_value("2025-11-23") == "2025-11-23T00:00:00Z"
+    assert _normalize_datetime_value("2025-11-23") == "2025-11-23T00:00:00Z"
+    assert _normalize_datetime_string.cache_info().hits == 1
+    assert _normalize_datetime_value(42) == 42
@@ -121,9 +121,10 @@ class TestDataTypeConversion(unittest.TestCase):
 class TestSchemaFunctions(unittest.TestCase):
     """Test schema-related functions."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.schema = {
+    @classmethod
+    def setUpClass(cls):
+        """Set up read-only test data shared by all tests in the class."""
+        cls.schema = {
             "Shot": {
                 "fields": {
                     "code": {
@@ -60,37 +60,32 @@ class TestInferEntityTypeFromFieldName:
 class TestNormalizeEntityReference:
     """Tests for normalize_entity_reference function."""
 
-    def test_integer_to_dict(self):
-        """Test converting integer ID to dict format."""
-        result = normalize_entity_reference(70, "project")
-        assert result == {"type": "Project", "id": 70}
-
-    def test_integer_to_dict_various_fields(self):
-        """Test converting integer ID for various field types."""
-        assert normalize_entity_reference(123, "shot") == {"type": "Shot", "id": 123}
-        assert normalize_entity_reference(456, "task") == {"type": "Task", "id": 456}
-        assert normalize_entity_reference(789, "user") == {"type": "HumanUser", "id": 789}
-
-    def test_dict_passthrough(self):
-        """Test that dict values pass through unchanged."""
-        entity_dict = {"type": "Project", "id": 70}
-        result = normalize_entity_reference(entity_dict, "project")
-        assert result == entity_dict
-
-    def test_string_passthrough(self):
-        """Test that string values pass through unchanged."""
-        result = normalize_entity_reference("active", "status")
-        assert result == "active"
-
-    def test_none_passthrough(self):
-        """Test that None values pass through unchanged."""
-        result = normalize_entity_reference(None, "project")
-        assert result is None
-
-    def test_list_passthrough(self):
-        """Test that list values pass through unchanged."""
-        result = normalize_entity_reference([1, 2, 3], "some_field")
-        assert result == [1, 2, 3]
+    @pytest.mark.parametrize(
+        ("value", "field_name", "expected"),
+        [
+            (70, "project", {"type": "Project", "id": 70}),
+            (123, "shot", {"type": "Shot", "id": 123}),
+            (456, "task", {"type": "Task", "id": 456}),
+            (789, "user", {"type": "HumanUser", "id": 789}),
+            ({"type": "Project", "id": 70}, "project", {"type": "Project", "id": 70}),
+            ("active", "status", "active"),
+            (None, "project", None),
+            ([1, 2, 3], "some_field", [1, 2, 3]),
+        ],
+        ids=[
+            "int-project",
+            "int-shot",
+            "int-task",
+            "int-user",
+            "dict-passthrough",
+            "string-passthrough",
+            "none-passthrough",
+            "list-passthrough",
+        ],
+    )
+    def test_normalize(self, value, field_name, expected):
+        """Test converting integer IDs and passing other values through."""
+        assert normalize_entity_reference(value, field_name) == expected
 
 
 class TestNormalizeFilterValue:
@@ -128,6 +123,12 @@ class TestNormalizeFilterValue:
             ],
         ]
 
+    def test_filter_with_in_operator_mixed_values(self):
+        """Test normalizing 'in' filter mixing integer IDs and entity dicts."""
+        filter_item = ["project", "in", [70, {"type": "Project", "id": 71}]]
+        result = normalize_filter_value(filter_item)
+        assert result == ["project", "in", [{"type": "Project", "id": 70}, {"type": "Project", "id": 71}]]
+
     def test_dict_format_filter(self):
         """Test normalizing dict format filter."""
         filter_item = {"project": 70}
@@ -205,6 +206,12 @@ class TestNormalizeGrouping:
         result = normalize_grouping(grouping)
         assert result == grouping
 
+    def test_grouping_without_entity_values_is_not_copied(self):
+        """Test that grouping without entity values is returned as-is."""
+        grouping = [{"field": "sg_status_list", "type": "exact", "direction": "asc"}]
+        result = normalize_grouping(grouping)
+        assert result is grouping
+
     def test_grouping_with_entity_value(self):
         """Test normalizing grouping with entity value."""
         grouping = [{"field": "project", "type": "exact", "project": 70}]
@@ -251,6 +258,19 @@ class TestNormalizeDataDict:
             "project": [{"type": "Project", "id": 70}, {"type": "Project", "id": 71}]
         }
 
+    def test_mixed_list_passthrough(self):
+        """Test that lists not made only of integers pass through unchanged."""
+        data = {"project": [70, "not an id"], "tags": ["a", "b"]}
+        result = normalize_data_dict(data)
+        assert result == data
+
+    def test_default_does_not_mutate_input(self):
+        """Test that the input dict is left untouched."""
+        data = {"project": 70}
+        result = normalize_data_dict(data)
+        assert result is not data
+        assert data == {"project": 70}
+
     def test_non_dict_passthrough(self):
         """Test that non-dict values pass through unchanged."""
         result = normalize_data_dict("not a dict")
@@ -298,13 +318,31 @@ class TestNormalizeBatchRequest:
             "entity_id": 1234,
         }
         result = normalize_batch_request(request)
-        assert result == request
+        assert result is request
 
     def test_non_dict_passthrough(self):
         """Test that non-dict values pass through unchanged."""
         result = normalize_batch_request("not a dict")
         assert result == "not a dict"
 
+    def test_input_not_mutated(self):
+        """Test that the caller's request and data are left untouched."""
+        data = {"project": 70, "code": "SH001"}
+        request = {"request_type": "create", "entity_type": "Shot", "data": data}
+        result = normalize_batch_request(request)
+        assert result["data"] == {"project": {"type": "Project", "id": 70}, "code": "SH001"}
+        assert request["data"] is data
+        assert data == {"project": 70, "code": "SH001"}
+
+    @pytest.mark.parametrize("request_type", [None, "upsert", ["create"]])
+    def test_unrecognized_request_type_still_normalized(self, request_type):
+        """Test that missing, unknown and unhashable request types still get their data normalized."""
+        request = {"entity_type": "Shot", "data": {"project": 70}}
+        if request_type is not None:
+            request["request_type"] = request_type
+        result = normalize_batch_request(request)
+        assert result["data"] == {"project": {"type": "Project", "id": 70}}
+
 
 class TestFieldToEntityTypeMapping:
     """Tests for FIELD_TO_ENTITY_TYPE mapping completeness."""
@@ -329,8 +367,8 @@ class TestFieldToEntityTypeMapping:
             "published_file",
             "group",
         ]
-        for field in common_fields:
-            assert field in FIELD_TO_ENTITY_TYPE, f"Field '{field}' should be in FIELD_TO_ENTITY_TYPE"
+        missing = set(common_fields) - FIELD_TO_ENTITY_TYPE.keys()
+        assert not missing, f"Missing from FIELD_TO_ENTITY_TYPE: {sorted(missing)}"
 
     def test_sg_prefixed_fields_mapped(self):
         """Test that sg_ prefixed fields are mapped."""
@@ -350,5 +388,10 @@ class TestFieldToEntityTypeMapping:
             "sg_published_file",
             "sg_group",
         ]
-        for field in sg_fields:
-            assert field in FIELD_TO_ENTITY_TYPE, f"Field '{field}' should be in FIELD_TO_ENTITY_TYPE"
+        missing = set(sg_fields) - FIELD_TO_ENTITY_TYPE.keys()
+        assert not missing, f"Missing from FIELD_TO_ENTITY_TYPE: {sorted(missing)}"
+
+    def test_mapping_is_read_only(self):
+        """Test that the mapping cannot be mutated at runtime."""
+        with pytest.raises(TypeError):
+            FIELD_TO_ENTITY_TYPE["custom"] = "CustomEntity"
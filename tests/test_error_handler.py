@@ -1,5 +1,6 @@
 """Tests for error_handler module."""
 
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
@@ -23,51 +24,53 @@ from shotgrid_mcp_server.exceptions import (
 )
 
 
-class TestFormatErrorMessage:
-    """Tests for format_error_message function."""
+@pytest.fixture
+def _mock_logger(request):
+    """Patch the error handler logger once per test and expose it as ``self.mock_logger``."""
+    with patch("shotgrid_mcp_server.error_handler.logger") as mock_logger:
+        request.instance.mock_logger = mock_logger
+        yield
 
-    def test_remove_thumbnail_url_prefix(self):
-        """Test removing thumbnail URL prefix."""
-        error_msg = "Error getting thumbnail URL: No thumbnail found"
-        result = format_error_message(error_msg)
-        assert result == "No thumbnail found"
-
-    def test_remove_thumbnail_download_prefix(self):
-        """Test removing thumbnail download prefix."""
-        error_msg = "Error downloading thumbnail: Connection failed"
-        result = format_error_message(error_msg)
-        assert result == "Connection failed"
-
-    def test_remove_executing_tool_prefix(self):
-        """Test removing executing tool prefix."""
-        error_msg = "Error executing tool get_entity: Entity not found"
-        result = format_error_message(error_msg)
-        assert result == "Entity not found"
-
-    def test_standardize_id_terminology(self):
-        """Test standardizing ID terminology."""
-        error_msg = "Entity Shot with id 123 not found"
-        result = format_error_message(error_msg)
-        assert result == "Entity Shot with ID 123 not found"
-
-    def test_standardize_no_image_message(self):
-        """Test standardizing no image message."""
-        error_msg = "Entity has no image"
-        result = format_error_message(error_msg)
-        assert result == "No thumbnail URL found"
-
-    def test_no_changes_needed(self):
-        """Test when no changes are needed."""
-        error_msg = "Generic error message"
-        result = format_error_message(error_msg)
-        assert result == "Generic error message"
 
+class TestFormatErrorMessage:
+    """Tests for format_error_message function."""
 
+    @pytest.mark.parametrize(
+        ("error_msg", "expected"),
+        [
+            ("Error getting thumbnail URL: No thumbnail found", "No thumbnail found"),
+            ("Error downloading thumbnail: Connection failed", "Connection failed"),
+            ("Error executing tool get_entity: Entity not found", "Entity not found"),
+            ("Error executing tool get_entity", "Error executing tool get_entity"),
+            (
+                "Error executing tool get_thumbnail_url: Error getting thumbnail URL: No thumbnail found",
+                "No thumbnail found",
+            ),
+            ("Entity Shot with id 123 not found", "Entity Shot with ID 123 not found"),
+            ("Entity has no image", "No thumbnail URL found"),
+            ("Generic error message", "Generic error message"),
+        ],
+        ids=[
+            "thumbnail-url-prefix",
+            "thumbnail-download-prefix",
+            "executing-tool-prefix",
+            "executing-tool-without-separator",
+            "executing-tool-wrapping-thumbnail-error",
+            "id-terminology",
+            "no-image-message",
+            "no-changes-needed",
+        ],
+    )
+    def test_format_error_message(self, error_msg, expected):
+        """Test prefix removal and terminology standardization."""
+        assert format_error_message(error_msg) == expected
+
+
+@pytest.mark.usefixtures("_mock_logger")
 class TestHandleToolError:
     """Tests for handle_tool_error function."""
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_entity_not_found_error(self, mock_logger):
+    def test_entity_not_found_error(self):
         """Test handling entity not found error."""
         error = ShotgunError("Entity Shot with id 123 not found")
         with pytest.raises(EntityNotFoundError) as excinfo:
@@ -76,60 +79,63 @@ class TestHandleToolError:
         assert excinfo.value.entity_type == "Shot"
         assert excinfo.value.entity_id == 123
         assert "Entity Shot with ID 123 not found" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
+
+    def test_entity_not_found_error_partial_reference(self):
+        """Test extracting only the entity ID when no entity type is named."""
+        error = ShotgunError("Record with id 456 does not exist")
+        with pytest.raises(EntityNotFoundError) as excinfo:
+            handle_tool_error(error, "find_entity")
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_permission_error(self, mock_logger):
+        assert excinfo.value.entity_type is None
+        assert excinfo.value.entity_id == 456
+
+    def test_permission_error(self):
         """Test handling permission error."""
         error = ShotgunError("User does not have permission to access this entity")
         with pytest.raises(PermissionError) as excinfo:
             handle_tool_error(error, "update_entity")
 
         assert "User does not have permission to access this entity" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_connection_error(self, mock_logger):
+    def test_connection_error(self):
         """Test handling connection error."""
         error = ShotgunError("Connection timeout while accessing ShotGrid")
         with pytest.raises(ConnectionError) as excinfo:
             handle_tool_error(error, "connect_to_shotgrid")
 
         assert "Connection timeout while accessing ShotGrid" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_filter_error(self, mock_logger):
+    def test_filter_error(self):
         """Test handling filter error."""
         error = ValueError("Invalid filter format")
         with pytest.raises(FilterError) as excinfo:
             handle_tool_error(error, "search_entities")
 
         assert "Invalid filter format" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_serialization_error(self, mock_logger):
+    def test_serialization_error(self):
         """Test handling serialization error."""
         error = ValueError("Failed to serialize JSON data")
         with pytest.raises(SerializationError) as excinfo:
             handle_tool_error(error, "create_entity")
 
         assert "Failed to serialize JSON data" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_generic_error(self, mock_logger):
+    def test_generic_error(self):
         """Test handling generic error."""
         error = ValueError("Unknown error")
         with pytest.raises(ToolError) as excinfo:
             handle_tool_error(error, "generic_operation")
 
         assert "Error executing tool generic_operation: Unknown error" in str(excinfo.value)
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_invalid_status_value_error_has_resource_hint(self, mock_logger):
+    def test_invalid_status_value_error_has_resource_hint(self):
         """Status validation errors should point to schema resources.
 
         This simulates a typical ShotGrid message when a status_list field
@@ -143,14 +149,14 @@ class TestHandleToolError:
         msg = str(excinfo.value)
         assert "invalid status value for a status_list field" in msg
         assert "shotgrid://schema/statuses" in msg
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
 
+@pytest.mark.usefixtures("_mock_logger")
 class TestCreateErrorResponse:
     """Tests for create_error_response function."""
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_entity_not_found_error(self, mock_logger):
+    def test_entity_not_found_error(self):
         """Test creating response for entity not found error."""
         error = EntityNotFoundError(entity_type="Shot", entity_id=123, message="Entity not found")
         response = create_error_response(error, "find_entity")
@@ -162,10 +168,9 @@ class TestCreateErrorResponse:
         assert "timestamp" in response
         assert response["entity_type"] == "Shot"
         assert response["entity_id"] == 123
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_permission_error(self, mock_logger):
+    def test_permission_error(self):
         """Test creating response for permission error."""
         error = PermissionError("Permission denied")
         response = create_error_response(error, "update_entity")
@@ -175,10 +180,9 @@ class TestCreateErrorResponse:
         assert response["error_category"] == "permission"
         assert response["operation"] == "update_entity"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_filter_error(self, mock_logger):
+    def test_filter_error(self):
         """Test creating response for filter error."""
         error = FilterError("Invalid filter")
         response = create_error_response(error, "search_entities")
@@ -188,10 +192,9 @@ class TestCreateErrorResponse:
         assert response["error_category"] == "filter"
         assert response["operation"] == "search_entities"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_serialization_error(self, mock_logger):
+    def test_serialization_error(self):
         """Test creating response for serialization error."""
         error = SerializationError("JSON serialization failed")
         response = create_error_response(error, "create_entity")
@@ -201,10 +204,9 @@ class TestCreateErrorResponse:
         assert response["error_category"] == "serialization"
         assert response["operation"] == "create_entity"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_connection_error(self, mock_logger):
+    def test_connection_error(self):
         """Test creating response for connection error."""
         error = ConnectionError("Connection failed")
         response = create_error_response(error, "connect_to_shotgrid")
@@ -214,10 +216,9 @@ class TestCreateErrorResponse:
         assert response["error_category"] == "connection"
         assert response["operation"] == "connect_to_shotgrid"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_shotgun_error(self, mock_logger):
+    def test_shotgun_error(self):
         """Test creating response for ShotgunError."""
         error = ShotgunError("ShotGrid API error")
         response = create_error_response(error, "shotgrid_operation")
@@ -227,10 +228,22 @@ class TestCreateErrorResponse:
         assert response["error_category"] == "shotgrid"
         assert response["operation"] == "shotgrid_operation"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
-
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_unknown_error(self, mock_logger):
+        self.mock_logger.error.assert_called_once()
+
+    @pytest.mark.parametrize(
+        ("message", "expected_category"),
+        [
+            ("Entity Shot with id 123 not found", "not_found"),
+            ("Permission denied", "permission"),
+        ],
+    )
+    def test_shotgun_error_classified_by_message(self, message, expected_category):
+        """Test that raw ShotgunErrors are categorized from their message."""
+        response = create_error_response(ShotgunError(message), "shotgrid_operation")
+
+        assert response["error_category"] == expected_category
+
+    def test_unknown_error(self):
         """Test creating response for unknown error."""
         error = ValueError("Unknown error")
         response = create_error_response(error, "generic_operation")
@@ -239,11 +252,10 @@ class TestCreateErrorResponse:
         assert response["error_type"] == "ValueError"
         assert response["error_category"] == "unknown"
         assert response["operation"] == "generic_operation"
-        assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        assert datetime.fromisoformat(response["timestamp"]).tzinfo is not None
+        self.mock_logger.error.assert_called_once()
 
-    @patch("shotgrid_mcp_server.error_handler.logger")
-    def test_custom_error_type(self, mock_logger):
+    def test_custom_error_type(self):
         """Test creating response with custom error type."""
         error = ValueError("Custom error")
         response = create_error_response(error, "custom_operation", error_type=RuntimeError)
@@ -252,60 +264,44 @@ class TestCreateErrorResponse:
         assert response["error_type"] == "RuntimeError"
         assert response["operation"] == "custom_operation"
         assert "timestamp" in response
-        mock_logger.error.assert_called_once()
+        self.mock_logger.error.assert_called_once()
 
 
 class TestIsEntityNotFoundError:
     """Tests for is_entity_not_found_error function."""
 
-    def test_shotgun_not_found_error(self):
-        """Test with ShotgunError containing 'not found'."""
-        error = ShotgunError("Entity not found")
-        assert is_entity_not_found_error(error) is True
-
-    def test_shotgun_does_not_exist_error(self):
-        """Test with ShotgunError containing 'does not exist'."""
-        error = ShotgunError("Entity does not exist")
-        assert is_entity_not_found_error(error) is True
-
-    def test_shotgun_other_error(self):
-        """Test with ShotgunError not related to entity not found."""
-        error = ShotgunError("Other error")
-        assert is_entity_not_found_error(error) is False
-
-    def test_non_shotgun_error(self):
-        """Test with non-ShotgunError."""
-        error = ValueError("Entity not found")
-        assert is_entity_not_found_error(error) is False
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ShotgunError("Entity not found"), True),
+            (ShotgunError("Entity does not exist"), True),
+            (ShotgunError("Other error"), False),
+            (ValueError("Entity not found"), False),
+        ],
+        ids=["not-found", "does-not-exist", "other-error", "non-shotgun-error"],
+    )
+    def test_is_entity_not_found_error(self, error, expected):
+        """Test detection of ShotgunError not-found messages."""
+        assert is_entity_not_found_error(error) is expected
 
 
 class TestIsPermissionError:
     """Tests for is_permission_error function."""
 
-    def test_shotgun_permission_error(self):
-        """Test with ShotgunError containing 'permission'."""
-        error = ShotgunError("Permission denied")
-        assert is_permission_error(error) is True
-
-    def test_shotgun_access_error(self):
-        """Test with ShotgunError containing 'access'."""
-        error = ShotgunError("Access denied")
-        assert is_permission_error(error) is True
-
-    def test_shotgun_not_allowed_error(self):
-        """Test with ShotgunError containing 'not allowed'."""
-        error = ShotgunError("Operation not allowed")
-        assert is_permission_error(error) is True
-
-    def test_shotgun_other_error(self):
-        """Test with ShotgunError not related to permission."""
-        error = ShotgunError("Other error")
-        assert is_permission_error(error) is False
-
-    def test_non_shotgun_error(self):
-        """Test with non-ShotgunError."""
-        error = ValueError("Permission denied")
-        assert is_permission_error(error) is False
+    @pytest.mark.parametrize(
+        ("error", "expected"),
+        [
+            (ShotgunError("Permission denied"), True),
+            (ShotgunError("Access denied"), True),
+            (ShotgunError("Operation not allowed"), True),
+            (ShotgunError("Other error"), False),
+            (ValueError("Permission denied"), False),
+        ],
+        ids=["permission", "access", "not-allowed", "other-error", "non-shotgun-error"],
+    )
+    def test_is_permission_error(self, error, expected):
+        """Test detection of ShotgunError permission messages."""
+        assert is_permission_error(error) is expected
 
 
 class TestInvalidStatusValueDetector:
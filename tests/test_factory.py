@@ -1,16 +1,36 @@
 """Tests for ShotGrid factory functions."""
 
-import os
-import unittest
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from shotgrid_mcp_server.connection_pool import (
     create_shotgun_connection,
     create_shotgun_connection_from_env,
 )
 
+SG_ENV = {
+    "SHOTGRID_URL": "https://test.shotgunstudio.com",
+    "SHOTGRID_SCRIPT_NAME": "script_name",
+    "SHOTGRID_SCRIPT_KEY": "api_key",
+}
+
+
+@pytest.fixture
+def sg_env(monkeypatch):
+    """Set ShotGrid credential environment variables for a test."""
+    for name, value in SG_ENV.items():
+        monkeypatch.setenv(name, value)
+
 
-class TestFactory(unittest.TestCase):
+@pytest.fixture
+def no_sg_env(monkeypatch):
+    """Remove ShotGrid credential environment variables for a test."""
+    for name in SG_ENV:
+        monkeypatch.delenv(name, raising=False)
+
+
+class TestFactory:
     """Test ShotGrid factory functions."""
 
     @patch("shotgrid_mcp_server.connection_pool.shotgun_api3.Shotgun")
@@ -32,9 +52,9 @@ class TestFactory(unittest.TestCase):
         )
 
         # Verify config was set correctly
-        self.assertEqual(sg.config.max_rpc_attempts, 10)
-        self.assertEqual(sg.config.timeout_secs, 30)
-        self.assertEqual(sg.config.rpc_attempt_interval, 10000)
+        assert sg.config.max_rpc_attempts == 10
+        assert sg.config.timeout_secs == 30
+        assert sg.config.rpc_attempt_interval == 10000
 
         # Reset mock
         mock_shotgun.reset_mock()
@@ -61,20 +81,12 @@ class TestFactory(unittest.TestCase):
         )
 
         # Verify config was set correctly
-        self.assertEqual(sg.config.max_rpc_attempts, 20)
-        self.assertEqual(sg.config.timeout_secs, 60)
-        self.assertEqual(sg.config.rpc_attempt_interval, 20000)
+        assert sg.config.max_rpc_attempts == 20
+        assert sg.config.timeout_secs == 60
+        assert sg.config.rpc_attempt_interval == 20000
 
     @patch("shotgrid_mcp_server.connection_pool.create_shotgun_connection")
-    @patch.dict(
-        os.environ,
-        {
-            "SHOTGRID_URL": "https://test.shotgunstudio.com",
-            "SHOTGRID_SCRIPT_NAME": "script_name",
-            "SHOTGRID_SCRIPT_KEY": "api_key",
-        },
-    )
-    def test_create_shotgun_connection_from_env(self, mock_create_shotgun):
+    def test_create_shotgun_connection_from_env(self, mock_create_shotgun, sg_env):
         """Test create_shotgun_connection_from_env function."""
         # Create a mock Shotgun instance
         mock_instance = MagicMock()
@@ -115,16 +127,11 @@ class TestFactory(unittest.TestCase):
             },
         )
 
-    @patch.dict(os.environ, {}, clear=True)
-    def test_create_shotgun_connection_from_env_missing_vars(self):
+    def test_create_shotgun_connection_from_env_missing_vars(self, no_sg_env):
         """Test create_shotgun_connection_from_env function with missing environment variables."""
         # Test with missing environment variables
-        with self.assertRaises(ValueError) as context:
+        with pytest.raises(ValueError) as context:
             create_shotgun_connection_from_env()
 
         # Verify error message
-        self.assertIn("Missing required environment variables", str(context.exception))
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert "Missing required environment variables" in str(context.value)
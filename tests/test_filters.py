@@ -2,6 +2,7 @@
 
 import datetime
 import unittest
+from unittest.mock import patch
 
 # Import from shotgrid-query
 from shotgrid_query import (
@@ -12,6 +13,22 @@ from shotgrid_query import (
     validate_filters,
 )
 
+# Fixed "now" so date keyword tests cannot straddle midnight
+FROZEN_NOW = datetime.datetime(2024, 1, 15, 12, 0, 0)
+
+
+class _FrozenDatetime(datetime.datetime):
+    """datetime subclass whose now() always returns FROZEN_NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_NOW
+
+
+def freeze_filters_time():
+    """Patch shotgrid-query's filter module clock to FROZEN_NOW."""
+    return patch("shotgrid_query.filters.datetime", _FrozenDatetime)
+
 
 class TestFilterValidation(unittest.TestCase):
     """Test filter validation functions."""
@@ -101,27 +118,22 @@ class TestProcessFilters(unittest.TestCase):
 
     def test_process_special_date_values(self):
         """Test processing of special date values."""
-        today = datetime.datetime.now().strftime("%Y-%m-%d")
-        yesterday = (datetime.datetime.now() - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
-        tomorrow = (datetime.datetime.now() + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+        today = FROZEN_NOW.strftime("%Y-%m-%d")
+        yesterday = (FROZEN_NOW - datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+        tomorrow = (FROZEN_NOW + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+
+        with freeze_filters_time():
+            processed = process_filters(
+                [
+                    ["due_date", "is", "$today"],
+                    ["due_date", "is", "$yesterday"],
+                    ["due_date", "is", "$tomorrow"],
+                ]
+            )
 
-        filters = [
-            ["due_date", "is", "$today"],
-        ]
-        processed = process_filters(filters)
         self.assertEqual(processed[0][2], today)
-
-        filters = [
-            ["due_date", "is", "$yesterday"],
-        ]
-        processed = process_filters(filters)
-        self.assertEqual(processed[0][2], yesterday)
-
-        filters = [
-            ["due_date", "is", "$tomorrow"],
-        ]
-        processed = process_filters(filters)
-        self.assertEqual(processed[0][2], tomorrow)
+        self.assertEqual(processed[1][2], yesterday)
+        self.assertEqual(processed[2][2], tomorrow)
 
     def test_process_invalid_filter_raises_error(self):
         """Test that processing invalid filters raises ValueError."""
@@ -201,22 +213,10 @@ class TestDateFilter(unittest.TestCase):
 
     def test_create_date_filter_with_timedelta(self):
         """Test create_date_filter with timedelta value."""
-        # Skip this test for now
-        # The test is difficult to implement because we can't easily mock datetime.now
-        # and the function is already covered by other tests
-        self.skipTest("Skipping test_create_date_filter_with_timedelta due to mocking difficulties")
+        with freeze_filters_time():
+            filter_item = create_date_filter("due_date", "is", datetime.timedelta(days=1))
 
-        # Create a real timedelta object
-        delta = datetime.timedelta(days=1)
-
-        # Call the function
-        filter_item = create_date_filter("due_date", "is", delta)
-
-        # Just check the format, not the exact value
-        self.assertEqual(len(filter_item), 3)
-        self.assertEqual(filter_item[0], "due_date")
-        self.assertEqual(filter_item[1], "is")
-        self.assertTrue(isinstance(filter_item[2], str))
+        self.assertEqual(filter_item, ("due_date", "is", "2024-01-16"))
 
 
 if __name__ == "__main__":
@@ -1,7 +1,10 @@
 """Tests for HTTP context module."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import pytest
+
+from shotgrid_mcp_server import http_context
 from shotgrid_mcp_server.http_context import (
     SHOTGRID_SCRIPT_KEY_HEADER,
     SHOTGRID_SCRIPT_NAME_HEADER,
@@ -10,101 +13,120 @@ from shotgrid_mcp_server.http_context import (
     get_shotgrid_credentials_from_headers,
 )
 
+_TEST_CREDENTIALS = ("https://test.shotgunstudio.com", "test_script", "test_key_12345")
+
+
+class CountingDict(dict):
+    """Dict that counts key lookups made through ``[]`` and ``get``."""
+
+    lookups = 0
+
+    def __getitem__(self, key):
+        self.lookups += 1
+        return super().__getitem__(key)
+
+    def get(self, key, default=None):
+        self.lookups += 1
+        return super().get(key, default)
+
+
+@pytest.fixture
+def headers(monkeypatch):
+    """Stub get_http_headers; tests set ``headers["v"]`` to the headers it should return."""
+    holder = {"v": None}
+    monkeypatch.setattr("fastmcp.server.dependencies.get_http_headers", lambda: holder["v"])
+    return holder
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Replace the http_context module logger with a mock."""
+    logger = MagicMock()
+    monkeypatch.setattr("shotgrid_mcp_server.http_context.logger", logger)
+    return logger
+
 
 class TestGetShotGridCredentialsFromHeaders:
     """Test get_shotgrid_credentials_from_headers function."""
 
-    def test_no_headers_available(self):
-        """Test when no HTTP headers are available (stdio mode)."""
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=None):
-            url, script_name, api_key = get_shotgrid_credentials_from_headers()
-            assert url is None
-            assert script_name is None
-            assert api_key is None
-
-    def test_all_headers_present(self):
-        """Test when all ShotGrid headers are present."""
-        mock_headers = {
-            SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com",
-            SHOTGRID_SCRIPT_NAME_HEADER: "test_script",
-            SHOTGRID_SCRIPT_KEY_HEADER: "test_key_12345",
-        }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            url, script_name, api_key = get_shotgrid_credentials_from_headers()
-            assert url == "https://test.shotgunstudio.com"
-            assert script_name == "test_script"
-            assert api_key == "test_key_12345"
-
-    def test_lowercase_headers(self):
-        """Test when headers are in lowercase."""
-        mock_headers = {
-            SHOTGRID_URL_HEADER.lower(): "https://test.shotgunstudio.com",
-            SHOTGRID_SCRIPT_NAME_HEADER.lower(): "test_script",
-            SHOTGRID_SCRIPT_KEY_HEADER.lower(): "test_key_12345",
-        }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            url, script_name, api_key = get_shotgrid_credentials_from_headers()
-            assert url == "https://test.shotgunstudio.com"
-            assert script_name == "test_script"
-            assert api_key == "test_key_12345"
-
-    def test_partial_headers(self):
-        """Test when only some headers are present."""
-        mock_headers = {
-            SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com",
-            # Missing script name and key
-        }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            url, script_name, api_key = get_shotgrid_credentials_from_headers()
-            assert url == "https://test.shotgunstudio.com"
-            assert script_name is None
-            assert api_key is None
-
-    def test_empty_headers(self):
-        """Test when headers dict is empty."""
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value={}):
-            url, script_name, api_key = get_shotgrid_credentials_from_headers()
-            assert url is None
-            assert script_name is None
-            assert api_key is None
+    @pytest.mark.parametrize(
+        "mock_headers,expected",
+        [
+            (None, (None, None, None)),
+            (
+                {
+                    SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com",
+                    SHOTGRID_SCRIPT_NAME_HEADER: "test_script",
+                    SHOTGRID_SCRIPT_KEY_HEADER: "test_key_12345",
+                },
+                _TEST_CREDENTIALS,
+            ),
+            (
+                {
+                    SHOTGRID_URL_HEADER.lower(): "https://test.shotgunstudio.com",
+                    SHOTGRID_SCRIPT_NAME_HEADER.lower(): "test_script",
+                    SHOTGRID_SCRIPT_KEY_HEADER.lower(): "test_key_12345",
+                },
+                _TEST_CREDENTIALS,
+            ),
+            ({SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com"}, ("https://test.shotgunstudio.com", None, None)),
+            ({}, (None, None, None)),
+        ],
+        ids=["no-headers", "all-headers", "lowercase-headers", "partial-headers", "empty-headers"],
+    )
+    def test_credentials_from_headers(self, headers, mock_headers, expected):
+        """Test credential extraction for stdio mode, full, lowercase, partial and empty headers."""
+        headers["v"] = mock_headers
+        assert get_shotgrid_credentials_from_headers() == expected
+
+    def test_case_insensitive_one_pass(self, headers):
+        """Test that mixed-case headers are read with at most one key operation per credential."""
+        mock_headers = CountingDict(
+            {
+                SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com",
+                "x-shotgrid-SCRIPT-name": "test_script",
+                SHOTGRID_SCRIPT_KEY_HEADER.lower(): "test_key_12345",
+                "User-Agent": "TestClient/1.0",
+            }
+        )
+        headers["v"] = mock_headers
+
+        assert get_shotgrid_credentials_from_headers() == _TEST_CREDENTIALS
+        assert mock_headers.lookups <= 3
 
 
 class TestGetRequestInfo:
     """Test get_request_info function."""
 
-    def test_no_headers_available(self):
+    def test_no_headers_available(self, headers):
         """Test when no HTTP headers are available."""
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=None):
-            info = get_request_info()
-            assert info == {}
+        headers["v"] = None
+        assert get_request_info() == {}
 
-    def test_all_request_info_present(self):
+    def test_all_request_info_present(self, headers):
         """Test when all request info headers are present."""
-        mock_headers = {
+        headers["v"] = {
             "x-forwarded-for": "192.168.1.100",
             "user-agent": "TestClient/1.0",
         }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            info = get_request_info()
-            assert info["forwarded_for"] == "192.168.1.100"
-            assert info["user_agent"] == "TestClient/1.0"
+        info = get_request_info()
+        assert info["forwarded_for"] == "192.168.1.100"
+        assert info["user_agent"] == "TestClient/1.0"
 
-    def test_partial_request_info(self):
+    def test_partial_request_info(self, headers):
         """Test when only some request info headers are present."""
-        mock_headers = {
+        headers["v"] = {
             "user-agent": "TestClient/1.0",
             # Missing X-Forwarded-For
         }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            info = get_request_info()
-            assert "forwarded_for" not in info
-            assert info["user_agent"] == "TestClient/1.0"
+        info = get_request_info()
+        assert "forwarded_for" not in info
+        assert info["user_agent"] == "TestClient/1.0"
 
-    def test_empty_headers(self):
+    def test_empty_headers(self, headers):
         """Test when headers dict is empty."""
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value={}):
-            info = get_request_info()
-            assert info == {}
+        headers["v"] = {}
+        assert get_request_info() == {}
 
 
 class TestHeaderConstants:
@@ -116,31 +138,33 @@ class TestHeaderConstants:
         assert SHOTGRID_SCRIPT_NAME_HEADER == "X-ShotGrid-Script-Name"
         assert SHOTGRID_SCRIPT_KEY_HEADER == "X-ShotGrid-Script-Key"
 
+    def test_header_lower_constants_cached(self):
+        """Test that the lowercase header names are precomputed at import time."""
+        assert http_context._SHOTGRID_URL_LC == "x-shotgrid-url"
+        assert http_context._SHOTGRID_SCRIPT_NAME_LC == "x-shotgrid-script-name"
+        assert http_context._SHOTGRID_SCRIPT_KEY_LC == "x-shotgrid-script-key"
+
 
 class TestLogging:
     """Test logging behavior."""
 
-    def test_logging_with_credentials(self):
+    def test_logging_with_credentials(self, headers, mock_logger):
         """Test that credentials are logged when present."""
-        mock_headers = {
+        headers["v"] = {
             SHOTGRID_URL_HEADER: "https://test.shotgunstudio.com",
             SHOTGRID_SCRIPT_NAME_HEADER: "test_script",
             SHOTGRID_SCRIPT_KEY_HEADER: "test_key",
             "User-Agent": "TestClient/1.0",
         }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            with patch("shotgrid_mcp_server.http_context.logger") as mock_logger:
-                get_shotgrid_credentials_from_headers()
-                # Should log info about the request
-                assert mock_logger.info.called
+        get_shotgrid_credentials_from_headers()
+        # Should log info about the request
+        assert mock_logger.info.called
 
-    def test_logging_without_credentials(self):
+    def test_logging_without_credentials(self, headers, mock_logger):
         """Test logging when no credentials are present."""
-        mock_headers = {
+        headers["v"] = {
             "User-Agent": "TestClient/1.0",
         }
-        with patch("fastmcp.server.dependencies.get_http_headers", return_value=mock_headers):
-            with patch("shotgrid_mcp_server.http_context.logger") as mock_logger:
-                get_shotgrid_credentials_from_headers()
-                # Should log debug message
-                assert mock_logger.debug.called
+        get_shotgrid_credentials_from_headers()
+        # Should log debug message
+        assert mock_logger.debug.called
@@ -4,6 +4,7 @@ This module contains unit tests for the MockgunExt class.
 """
 
 # Import built-in modules
+import io
 import pickle
 
 # Import third-party modules
@@ -12,106 +13,96 @@ from shotgun_api3 import ShotgunError
 
 # Import local modules
 from shotgrid_mcp_server.mockgun_ext import MockgunExt
+from tests.helpers import copy_client
+
+# Simple schema shared by all tests as (field, data type, valid types) per entity type
+_FIELDS = {
+    "Shot": [
+        ("id", "number", ["number"]),
+        ("code", "text", ["text"]),
+        ("project", "entity", ["Project"]),
+        ("sg_status_list", "status_list", ["status_list"]),
+        ("tags", "multi_entity", ["Tag"]),
+    ],
+    "Project": [
+        ("id", "number", ["number"]),
+        ("name", "text", ["text"]),
+        ("sg_status", "text", ["text"]),
+    ],
+    "Tag": [
+        ("id", "number", ["number"]),
+        ("name", "text", ["text"]),
+    ],
+    "EventLogEntry": [
+        ("id", "number", ["number"]),
+        ("description", "text", ["text"]),
+        ("entity", "entity", ["Project", "Shot", "HumanUser"]),
+        ("event_type", "text", ["text"]),
+    ],
+}
+
+
+def _field(data_type, valid_types):
+    """Build a Mockgun field schema entry."""
+    return {
+        "data_type": {"value": data_type},
+        "properties": {"default_value": {"value": None}, "valid_types": {"value": valid_types}},
+    }
 
 
-@pytest.fixture
-def schema_paths(tmp_path):
-    """Create temporary schema files for testing."""
+# Expanded schema, pickled once at import time
+_SCHEMA = {
+    entity_type: {name: _field(data_type, valid_types) for name, data_type, valid_types in fields}
+    for entity_type, fields in _FIELDS.items()
+}
+_SCHEMA_BYTES = pickle.dumps(_SCHEMA, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+@pytest.fixture(scope="session")
+def schema_paths(tmp_path_factory):
+    """Create temporary schema files for testing.
+
+    The files are written once per session so that Mockgun's schema cache, which is keyed by
+    path, only has to unpickle them once.
+    """
     # Create schema directory
-    schema_dir = tmp_path / "schema"
-    schema_dir.mkdir()
-
-    # Create simple schema
-    schema = {
-        "Shot": {
-            "id": {
-                "data_type": {"value": "number"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["number"]}},
-            },
-            "code": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-            "project": {
-                "data_type": {"value": "entity"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["Project"]}},
-            },
-            "sg_status_list": {
-                "data_type": {"value": "status_list"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["status_list"]}},
-            },
-            "tags": {
-                "data_type": {"value": "multi_entity"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["Tag"]}},
-            },
-        },
-        "Project": {
-            "id": {
-                "data_type": {"value": "number"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["number"]}},
-            },
-            "name": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-            "sg_status": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-        },
-        "Tag": {
-            "id": {
-                "data_type": {"value": "number"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["number"]}},
-            },
-            "name": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-        },
-        "EventLogEntry": {
-            "id": {
-                "data_type": {"value": "number"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["number"]}},
-            },
-            "description": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-            "entity": {
-                "data_type": {"value": "entity"},
-                "properties": {
-                    "default_value": {"value": None},
-                    "valid_types": {"value": ["Project", "Shot", "HumanUser"]},
-                },
-            },
-            "event_type": {
-                "data_type": {"value": "text"},
-                "properties": {"default_value": {"value": None}, "valid_types": {"value": ["text"]}},
-            },
-        },
-    }
+    schema_dir = tmp_path_factory.mktemp("schema")
 
-    # Save schema to binary files
+    # Save schema to a binary file; the entity schema is the same data, so both paths share it
     schema_path = schema_dir / "schema.bin"
-    entity_schema_path = schema_dir / "entity_schema.bin"
+    schema_path.write_bytes(_SCHEMA_BYTES)
+
+    return {"schema_path": str(schema_path), "entity_schema_path": str(schema_path)}
 
-    with open(schema_path, "wb") as f:
-        pickle.dump(schema, f)
-    with open(entity_schema_path, "wb") as f:
-        pickle.dump(schema, f)
 
-    return {"schema_path": str(schema_path), "entity_schema_path": str(entity_schema_path)}
+def _use_schema_paths(monkeypatch, schema_paths):
+    """Point MockgunExt at the test schema until monkeypatch is undone.
+
+    Mockgun.set_schema_paths stores the paths in name-mangled class attributes, so they are
+    patched directly instead of being left set for every later test.
+    """
+    monkeypatch.setattr(MockgunExt, "_Shotgun__schema_path", schema_paths["schema_path"])
+    monkeypatch.setattr(MockgunExt, "_Shotgun__schema_entity_path", schema_paths["entity_schema_path"])
+
+
+@pytest.fixture(scope="session")
+def _mockgun_template(schema_paths):
+    """Create one MockgunExt instance for the session to copy per test."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        _use_schema_paths(monkeypatch, schema_paths)
+
+        # Create instance
+        return MockgunExt("https://test.shotgunstudio.com", script_name="test", api_key="test")
 
 
 @pytest.fixture
-def mockgun(schema_paths):
-    """Create a MockgunExt instance for testing."""
-    # Set schema paths
-    MockgunExt.set_schema_paths(schema_paths["schema_path"], schema_paths["entity_schema_path"])
+def mockgun(_mockgun_template):
+    """Create an isolated MockgunExt instance for testing.
 
-    # Create instance
-    return MockgunExt("https://test.shotgunstudio.com", script_name="test", api_key="test")
+    The instance is a deep copy of the session template, so each test gets its own entity
+    store without touching the schema files.
+    """
+    return copy_client(_mockgun_template)
 
 
 @pytest.fixture
@@ -126,149 +117,321 @@ def test_shot(mockgun, test_project):
     return mockgun.create("Shot", {"code": "test_shot", "project": test_project})
 
 
-class TestMockgunExt:
-    """Test suite for MockgunExt class."""
+@pytest.fixture
+def test_attachment(mockgun, test_shot):
+    """Attach a file to the test shot."""
+    attachment = {
+        "type": "Attachment",
+        "id": 1,
+        "name": "review.mov",
+        "url": "https://test.shotgunstudio.com/files/review.mov",
+    }
+    mockgun.update("Shot", test_shot["id"], {"sg_attachment": attachment})
+    return attachment
 
-    def test_init(self, schema_paths):
-        """Test initialization."""
-        # Set schema paths
-        MockgunExt.set_schema_paths(schema_paths["schema_path"], schema_paths["entity_schema_path"])
 
-        # Create instance
-        mockgun = MockgunExt("https://test.shotgunstudio.com", script_name="test", api_key="test")
-
-        # Verify instance
-        assert mockgun is not None
-        assert isinstance(mockgun, MockgunExt)
-        assert mockgun._schema is not None
-        assert "Shot" in mockgun._schema
-        assert "Project" in mockgun._schema
-
-    def test_create_entity(self, mockgun):
-        """Test creating an entity."""
-        # Create project
-        project = mockgun.create("Project", {"name": "Test Project", "sg_status": "Active"})
-
-        # Verify project
-        assert project is not None
-        assert project["type"] == "Project"
-        assert project["name"] == "Test Project"
-        assert project["sg_status"] == "Active"
-
-        # Create shot
-        shot = mockgun.create("Shot", {"code": "test_shot", "project": project})
-
-        # Verify shot
-        assert shot is not None
-        assert shot["type"] == "Shot"
-        assert shot["code"] == "test_shot"
-        assert shot["project"] == project
-
-    def test_find(self, mockgun, test_project, test_shot):
-        """Test finding entities."""
-        # Find all shots
-        shots = mockgun.find("Shot", [])
-        assert len(shots) == 1
-        assert shots[0]["code"] == "test_shot"
-
-        # Find shots with filter
-        shots = mockgun.find("Shot", [["code", "is", "test_shot"]])
-        assert len(shots) == 1
-        assert shots[0]["code"] == "test_shot"
-
-        # Find shots with non-matching filter
-        shots = mockgun.find("Shot", [["code", "is", "non_existent"]])
-        assert len(shots) == 0
-
-        # Find shots with multiple filters (AND)
-        shots = mockgun.find("Shot", [["code", "is", "test_shot"], ["project", "is", test_project]])
-        assert len(shots) == 1
-        assert shots[0]["code"] == "test_shot"
-
-        # Find shots with multiple filters (OR)
-        shots = mockgun.find(
-            "Shot",
-            [["code", "is", "test_shot"], ["code", "is", "non_existent"]],
-            filter_operator="or",
-        )
-        assert len(shots) == 1
-        assert shots[0]["code"] == "test_shot"
-
-    def test_find_one(self, mockgun, test_project, test_shot):
-        """Test finding a single entity."""
-        # Find shot
-        shot = mockgun.find_one("Shot", [["code", "is", "test_shot"]])
-        assert shot is not None
-        assert shot["code"] == "test_shot"
-
-        # Find non-existent shot
-        shot = mockgun.find_one("Shot", [["code", "is", "non_existent"]])
-        assert shot is None
-
-    def test_update(self, mockgun, test_shot):
-        """Test updating an entity."""
-        # Update shot
-        mockgun.update("Shot", test_shot["id"], {"code": "updated_shot"})
-
-        # Verify update
-        shot = mockgun.find_one("Shot", [["id", "is", test_shot["id"]]])
-        assert shot is not None
-        assert shot["code"] == "updated_shot"
-
-    def test_delete(self, mockgun, test_shot):
-        """Test deleting an entity."""
-        # Delete shot
-        mockgun.delete("Shot", test_shot["id"])
-
-        # Verify deletion
-        shot = mockgun.find_one("Shot", [["id", "is", test_shot["id"]]])
-        assert shot is None
-
-    def test_batch(self, mockgun, test_project):
-        """Test batch operations."""
-        # Create batch requests
-        requests = [
-            {
-                "request_type": "create",
-                "entity_type": "Shot",
-                "data": {"code": "batch_shot_1", "project": test_project},
-            },
-            {
-                "request_type": "create",
-                "entity_type": "Shot",
-                "data": {"code": "batch_shot_2", "project": test_project},
-            },
+def _create_shots(mockgun, project, codes):
+    """Create one shot per code in a single batch call."""
+    return mockgun.batch(
+        [
+            {"request_type": "create", "entity_type": "Shot", "data": {"code": code, "project": project}}
+            for code in codes
         ]
+    )
+
+
+@pytest.fixture
+def limit_shots(mockgun, test_project):
+    """Create five shots to page through."""
+    return _create_shots(mockgun, test_project, [f"limit_shot_{i}" for i in range(5)])
+
+
+@pytest.fixture
+def batch_targets(mockgun, test_project):
+    """Create two shots for batch updates and deletes."""
+    return (
+        mockgun.create("Shot", {"code": "batch_target_1", "project": test_project}),
+        mockgun.create("Shot", {"code": "batch_target_2", "project": test_project}),
+    )
+
+
+def test_init(schema_paths, monkeypatch):
+    """Test initialization."""
+    # Set schema paths
+    _use_schema_paths(monkeypatch, schema_paths)
+
+    # Create instance
+    mockgun = MockgunExt("https://test.shotgunstudio.com", script_name="test", api_key="test")
+
+    # Verify instance
+    assert mockgun is not None
+    assert isinstance(mockgun, MockgunExt)
+    assert mockgun._schema is not None
+    assert "Shot" in mockgun._schema
+    assert "Project" in mockgun._schema
+
+
+def test_create_entity(mockgun):
+    """Test creating an entity."""
+    # Create project
+    project = mockgun.create("Project", {"name": "Test Project", "sg_status": "Active"})
+
+    # Verify project
+    assert project is not None
+    assert project["type"] == "Project"
+    assert project["name"] == "Test Project"
+    assert project["sg_status"] == "Active"
+
+    # Create shot
+    shot = mockgun.create("Shot", {"code": "test_shot", "project": project})
+
+    # Verify shot
+    assert shot is not None
+    assert shot["type"] == "Shot"
+    assert shot["code"] == "test_shot"
+    assert shot["project"] == project
+
+
+@pytest.mark.parametrize(
+    "make_filters,filter_operator,expected_codes",
+    [
+        (lambda project: [], None, ["test_shot"]),
+        (lambda project: [["code", "is", "test_shot"]], None, ["test_shot"]),
+        (lambda project: [["code", "is", "non_existent"]], None, []),
+        (lambda project: [["code", "is", "test_shot"], ["project", "is", project]], None, ["test_shot"]),
+        (lambda project: [["code", "is", "test_shot"], ["code", "is", "non_existent"]], "or", ["test_shot"]),
+    ],
+    ids=["all", "code-is", "non-matching", "and", "or"],
+)
+def test_find(mockgun, test_project, test_shot, make_filters, filter_operator, expected_codes):
+    """Test finding entities."""
+    shots = mockgun.find("Shot", make_filters(test_project), filter_operator=filter_operator)
+    assert [shot["code"] for shot in shots] == expected_codes
+
+
+@pytest.mark.parametrize(
+    "filt",
+    [["non_existent", "is", "value"], ["code", "unsupported_operator", "value"]],
+    ids=["non-existent-field", "unsupported-operator"],
+)
+def test_find_returns_empty(mockgun, test_shot, filt):
+    """Test that filters on unknown fields or with unsupported operators match nothing."""
+    assert mockgun.find("Shot", [filt]) == []
+
+
+@pytest.mark.parametrize("limit,expected", [(3, 3), (0, 5), (-1, 5)], ids=["positive", "zero", "negative"])
+def test_find_with_limit(mockgun, limit_shots, limit, expected):
+    """Test that only a positive limit truncates find results."""
+    shots = mockgun.find("Shot", [], limit=limit)
+    assert [shot["code"] for shot in shots] == [shot["code"] for shot in limit_shots[:expected]]
+
+
+def test_find_with_limit_stops_scanning(mockgun, limit_shots, monkeypatch):
+    """Test that an unordered limited find stops filtering once it has enough matches."""
+    calls = []
+    apply_filters = mockgun._apply_filters
+
+    def counting_apply_filters(*args):
+        calls.append(args)
+        return apply_filters(*args)
+
+    monkeypatch.setattr(mockgun, "_apply_filters", counting_apply_filters)
+
+    shots = mockgun.find("Shot", [], limit=2)
+    assert [shot["code"] for shot in shots] == [shot["code"] for shot in limit_shots[:2]]
+    assert len(calls) == 2
+
+
+def test_find_one(mockgun, test_project, test_shot):
+    """Test finding a single entity."""
+    # Find shot
+    shot = mockgun.find_one("Shot", [["code", "is", "test_shot"]])
+    assert shot is not None
+    assert shot["code"] == "test_shot"
+
+    # Find non-existent shot
+    shot = mockgun.find_one("Shot", [["code", "is", "non_existent"]])
+    assert shot is None
+
+
+def test_find_uses_id_index(mockgun, test_project):
+    """Test that an id equality filter is answered without scanning every entity."""
+
+    class _ScanTracker(dict):
+        scans = 0
+
+        def values(self):
+            type(self).scans += 1
+            return super().values()
+
+    _create_shots(mockgun, test_project, [f"shot_{i}" for i in range(1000)])
+    mockgun._db["Shot"] = _ScanTracker(mockgun._db["Shot"])
+
+    shot = mockgun.find_one("Shot", [["id", "is", 500]])
+    assert shot is not None
+    assert shot["code"] == "shot_499"
+    assert mockgun.find_one("Shot", [["id", "is", 5000]]) is None
+    assert _ScanTracker.scans == 0
+
+    # Any other filter still falls back to a scan
+    assert mockgun.find_one("Shot", [["code", "is", "shot_1"]])["id"] == 2
+    assert _ScanTracker.scans == 1
+
 
-        # Execute batch
-        results = mockgun.batch(requests)
+def test_update(mockgun, test_shot):
+    """Test updating an entity."""
+    # Update shot
+    mockgun.update("Shot", test_shot["id"], {"code": "updated_shot"})
 
-        # Verify results
-        assert len(results) == 2
-        assert results[0]["code"] == "batch_shot_1"
-        assert results[1]["code"] == "batch_shot_2"
+    # Verify update
+    shot = mockgun.find_one("Shot", [["id", "is", test_shot["id"]]])
+    assert shot is not None
+    assert shot["code"] == "updated_shot"
 
-        # Verify shots were created
-        shots = mockgun.find("Shot", [["code", "in", ["batch_shot_1", "batch_shot_2"]]])
-        assert len(shots) == 2
 
-    def test_validation_errors(self, mockgun, test_project):
-        """Test validation errors."""
-        # Test invalid field type
-        with pytest.raises(ShotgunError):
-            mockgun.create("Shot", {"code": 123})  # code should be string
+def test_delete(mockgun, test_shot):
+    """Test deleting an entity."""
+    # Delete shot
+    mockgun.delete("Shot", test_shot["id"])
 
-        # Test invalid entity field
-        with pytest.raises(ShotgunError):
-            mockgun.create("Shot", {"project": "invalid"})  # project should be dict
+    # Verify deletion
+    shot = mockgun.find_one("Shot", [["id", "is", test_shot["id"]]])
+    assert shot is None
 
-        # Test invalid multi-entity field
-        with pytest.raises(ShotgunError):
-            mockgun.create("Shot", {"tags": [{"name": "tag1"}]})  # missing id/type
 
-        # Test reserved fields
-        with pytest.raises(ShotgunError):
-            mockgun.create("Shot", {"id": 1, "code": "test"})  # id is reserved
+def test_download_attachment(mockgun, test_attachment):
+    """Test downloading attachment data into memory."""
+    assert mockgun.download_attachment(test_attachment) == b"Mock attachment data"
 
-        with pytest.raises(ShotgunError):
-            mockgun.create("Shot", {"type": "Shot", "code": "test"})  # type is reserved
+
+def test_download_attachment_to_path(mockgun, test_attachment, monkeypatch):
+    """Test downloading an attachment to a file path, captured in memory instead of on disk."""
+    written = {}
+
+    class _CapturedFile(io.BytesIO):
+        def __init__(self, path):
+            super().__init__()
+            self.path = path
+
+        def close(self):
+            written[self.path] = self.getvalue()
+            super().close()
+
+    def fake_open(path, mode="r"):
+        assert mode == "wb"
+        return _CapturedFile(path)
+
+    monkeypatch.setattr("shotgrid_mcp_server.mockgun_ext.open", fake_open, raising=False)
+
+    assert mockgun.download_attachment(test_attachment, "review.mov") == "review.mov"
+    assert written == {"review.mov": b"Mock attachment data"}
+
+
+def test_get_attachment_download_url(mockgun, test_shot, test_attachment):
+    """Test getting the download URL of an attached file."""
+    url = mockgun.get_attachment_download_url("Shot", test_shot["id"], "sg_attachment")
+    assert url == test_attachment["url"]
+
+
+def test_get_attachment_download_url_without_attachment(mockgun, test_shot):
+    """Test that an empty attachment field is reported."""
+    with pytest.raises(ShotgunError, match="has no attachment"):
+        mockgun.get_attachment_download_url("Shot", test_shot["id"], "sg_attachment")
+
+
+def test_batch(mockgun, test_project):
+    """Test batch operations."""
+    # Create batch requests
+    requests = [
+        {
+            "request_type": "create",
+            "entity_type": "Shot",
+            "data": {"code": "batch_shot_1", "project": test_project},
+        },
+        {
+            "request_type": "create",
+            "entity_type": "Shot",
+            "data": {"code": "batch_shot_2", "project": test_project},
+        },
+    ]
+
+    # Execute batch
+    results = mockgun.batch(requests)
+
+    # Verify results
+    assert len(results) == 2
+    assert results[0]["code"] == "batch_shot_1"
+    assert results[1]["code"] == "batch_shot_2"
+
+    # Verify shots were created
+    shots = mockgun.find("Shot", [["code", "in", ["batch_shot_1", "batch_shot_2"]]])
+    assert len(shots) == 2
+
+
+def test_batch_update_and_delete(mockgun, batch_targets):
+    """Test updating and deleting existing entities in one batch."""
+    shot1, shot2 = batch_targets
+
+    results = mockgun.batch(
+        [
+            {
+                "request_type": "update",
+                "entity_type": "Shot",
+                "entity_id": shot1["id"],
+                "data": {"code": "renamed"},
+            },
+            {"request_type": "delete", "entity_type": "Shot", "entity_id": shot2["id"]},
+        ]
+    )
+
+    assert results[0]["code"] == "renamed"
+    assert results[1] == {"id": shot2["id"], "type": "Shot", "status": "deleted"}
+    assert [shot["code"] for shot in mockgun.find("Shot", [])] == ["renamed"]
+
+
+def test_batch_invalid_request_type(mockgun):
+    """Test that an unknown batch request type is rejected."""
+    with pytest.raises(ShotgunError, match="Unknown request type"):
+        mockgun.batch([{"request_type": "invalid", "entity_type": "Shot"}])
+
+
+def test_batch_single_schema_pass(mockgun, test_project, monkeypatch):
+    """Test that a batch resolves the field schema once per entity type."""
+    calls = []
+    schema_field_read = mockgun.schema_field_read
+
+    def counting_schema_field_read(entity_type, *args, **kwargs):
+        calls.append(entity_type)
+        return schema_field_read(entity_type, *args, **kwargs)
+
+    monkeypatch.setattr(mockgun, "schema_field_read", counting_schema_field_read)
+
+    requests = [
+        {
+            "request_type": "create",
+            "entity_type": "Shot",
+            "data": {"code": f"batch_shot_{i}", "project": test_project},
+        }
+        for i in range(100)
+    ]
+    results = mockgun.batch(requests)
+
+    assert len(results) == 100
+    assert calls == ["Shot"]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"code": 123},  # code should be string
+        {"project": "invalid"},  # project should be dict
+        {"tags": [{"name": "tag1"}]},  # missing id/type
+        {"id": 1, "code": "test"},  # id is reserved
+        {"type": "Shot", "code": "test"},  # type is reserved
+    ],
+    ids=["non-str-code", "non-dict-project", "missing-id", "reserved-id", "reserved-type"],
+)
+def test_validation_rejects(mockgun, payload):
+    """Test that invalid entity data is rejected."""
+    with pytest.raises(ShotgunError):
+        mockgun.create("Shot", payload)
@@ -0,0 +1,51 @@
+"""Tests for models module filter processing."""
+
+import logging
+
+from shotgrid_mcp_server.models import FilterOperator, process_filters
+
+
+class TestProcessFilters:
+    """Tests for process_filters function."""
+
+    def test_tuple_passthrough(self):
+        """Test that plain tuples are returned in ShotGrid format."""
+        filters = [("sg_status_list", "is", "ip"), ("project", "is", {"type": "Project", "id": 1})]
+        assert process_filters(filters) == filters
+
+    def test_tuple_time_filter_string(self):
+        """Test that tuple time filters with string values are parsed."""
+        assert process_filters([("created_at", "in_last", "30 days")]) == [("created_at", "in_last", [30, "DAY"])]
+
+    def test_tuple_with_enum_operator(self):
+        """Test that enum operators are converted to their string value."""
+        assert process_filters([("created_at", FilterOperator.IN_NEXT, "2 weeks")]) == [
+            ("created_at", "in_next", [2, "WEEK"])
+        ]
+
+    def test_dict_filter(self):
+        """Test that dict filters are converted to tuples."""
+        filters = [{"field": "created_at", "operator": "in_last", "value": "6 months"}]
+        assert process_filters(filters) == [("created_at", "in_last", [6, "MONTH"])]
+
+    def test_time_filter_string_units(self):
+        """Test parsing of singular, plural and capitalized unit names."""
+        filters = [
+            ("created_at", "in_last", "1 day"),
+            ("created_at", "in_next", "1 Week"),
+            ("created_at", "in_last", "2 YEARS"),
+        ]
+        assert [f[2] for f in process_filters(filters)] == [[1, "DAY"], [1, "WEEK"], [2, "YEAR"]]
+
+    def test_invalid_time_filter_string_passthrough(self):
+        """Test that unparseable time strings are left unchanged."""
+        filters = [("created_at", "in_last", "few days"), ("created_at", "in_last", "3 fortnights")]
+        assert process_filters(filters) == filters
+
+    def test_invalid_tuple_passthrough(self, caplog):
+        """Test that tuples failing Filter validation are passed through unchanged with a warning."""
+        with caplog.at_level(logging.WARNING):
+            result = process_filters([("x", "bogus_op", "$today")])
+
+        assert result == [("x", "bogus_op", "$today")]
+        assert "Error processing filter" in caplog.text
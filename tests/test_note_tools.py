@@ -1,11 +1,14 @@
 """Tests for note_tools module."""
 
+import asyncio
 import datetime
 import json
+import uuid
+from typing import Optional
 
 import pytest
-import pytest_asyncio
 from fastmcp import FastMCP
+from pydantic import ValidationError
 from shotgun_api3.lib.mockgun import Shotgun
 
 from shotgrid_mcp_server.models import (
@@ -16,19 +19,116 @@ from shotgrid_mcp_server.models import (
     NoteUpdateResponse,
 )
 from shotgrid_mcp_server.tools.note_tools import register_note_tools
-from tests.helpers import call_tool
+from tests.helpers import call_tool, copy_client
+
+# Fixed timestamp for created_at/updated_at, so notes don't depend on the clock
+_FROZEN_DT = datetime.datetime(2025, 1, 1, 12, 0, 0)
+
+
+def _unique(value: str) -> str:
+    """Suffix a name so entities created against the shared module client don't collide."""
+    return f"{value}_{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="module")
+def mock_sg(_mock_sg_template) -> Shotgun:
+    """Create one mock ShotGrid client shared by every test in this module.
+
+    Tests only look up the entities they created by id, so they can share a client instead of
+    copying the session template per test.
+    """
+    return copy_client(_mock_sg_template)
+
+
+@pytest.fixture(scope="module")
+def note_server(mock_sg: Shotgun) -> FastMCP:
+    """Create a FastMCP server with note tools registered, once per module."""
+    server = FastMCP("test-server")
+    register_note_tools(server, mock_sg)
+    return server
+
+
+@pytest.fixture(scope="module")
+def test_project(mock_sg: Shotgun) -> dict:
+    """Create the project shared by the note tests."""
+    return mock_sg.create(
+        "Project",
+        {
+            "name": _unique("Note Test Project"),
+            "code": _unique("note_test"),
+            "sg_status": "Active",
+        },
+    )
+
+
+@pytest.fixture(scope="module")
+def test_user(mock_sg: Shotgun) -> dict:
+    """Create the user shared by the note tests."""
+    return mock_sg.create(
+        "HumanUser",
+        {
+            "name": _unique("Test User"),
+            "login": _unique("test_user"),
+        },
+    )
+
+
+def _base_note(project_id: int) -> dict:
+    """Return the fields every test note starts from.
+
+    In Mockgun, note_links only accepts Version entities, so notes start with no links.
+    """
+    return {
+        "project": {"type": "Project", "id": project_id},
+        "note_links": [],
+        "created_at": _FROZEN_DT,
+        "updated_at": _FROZEN_DT,
+    }
+
+
+def _make_note(
+    mock_sg: Shotgun,
+    project: dict,
+    case: dict,
+    user: Optional[dict] = None,
+    link_entity_id: Optional[int] = None,
+) -> dict:
+    """Create a note the way create_note does, from a test case's subject and content."""
+    # Plain dict rather than NoteCreateRequest; test_note_request_models covers model validation
+    request = {
+        "project_id": project["id"],
+        "subject": case["subject"],
+        "content": case["content"],
+        "user_id": user["id"] if user else None,
+        "addressings_to": [user["id"]] if user else None,
+        "link_entity_type": "Shot" if link_entity_id else None,
+        "link_entity_id": link_entity_id,
+    }
+
+    note_data = {
+        **_base_note(request["project_id"]),
+        "subject": request["subject"],
+        "content": request["content"],
+    }
+
+    # Add optional fields
+    if request["user_id"]:
+        note_data["user"] = {"type": "HumanUser", "id": request["user_id"]}
+
+    if request["addressings_to"]:
+        note_data["addressings_to"] = [{"type": "HumanUser", "id": user_id} for user_id in request["addressings_to"]]
+
+    if request["link_entity_type"] and request["link_entity_id"]:
+        # Note: In Mockgun, note_links only accepts Version type
+        # We'll skip adding note_links here
+        pass
+
+    return mock_sg.create("Note", note_data)
 
 
 class TestNoteTools:
     """Tests for note tools."""
 
-    @pytest_asyncio.fixture
-    async def note_server(self, mock_sg: Shotgun) -> FastMCP:
-        """Create a FastMCP server with note tools registered."""
-        server = FastMCP("test-server")
-        register_note_tools(server, mock_sg)
-        return server
-
     def test_register_note_tools(self, mock_sg: Shotgun):
         """Test register_note_tools function."""
         # Create a server
@@ -42,55 +142,33 @@ class TestNoteTools:
         assert server is not None
         # We can't directly check the tools in a test, so we'll skip this assertion
 
-    def test_create_note(self, mock_sg: Shotgun):
-        """Test create_note function."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test user
-        user = mock_sg.create(
-            "HumanUser",
-            {
-                "name": "Test User",
-                "login": "test_user",
-            },
-        )
-
-        # Create request
-        request = NoteCreateRequest(
-            project_id=project["id"],
-            subject="Test Note",
-            content="This is a test note",
-            user_id=user["id"],
-            addressings_to=[user["id"]],
-        )
-
-        # Create note directly using mock_sg
-        note_data = {
-            "project": {"type": "Project", "id": request.project_id},
-            "subject": request.subject,
-            "content": request.content,
-            "note_links": [],  # Initialize empty note_links
-            "created_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default created_at
-            "updated_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default updated_at
-        }
-
-        # Add optional fields
-        if request.user_id:
-            note_data["user"] = {"type": "HumanUser", "id": request.user_id}
-
-        if request.addressings_to:
-            note_data["addressings_to"] = [{"type": "HumanUser", "id": user_id} for user_id in request.addressings_to]
-
-        # Create note
-        note = mock_sg.create("Note", note_data)
+    @pytest.mark.parametrize(
+        "case",
+        [
+            pytest.param(
+                {"subject": "Test Note", "content": "This is a test note", "with_user": True, "link": False},
+                id="plain",
+            ),
+            pytest.param(
+                {"subject": "Test Note with Link", "content": "This is a test note with link", "link": True},
+                id="with_link",
+            ),
+        ],
+    )
+    def test_create_note(self, mock_sg: Shotgun, test_project: dict, test_user: dict, case: dict):
+        """Test create_note function, with and without a link to an entity."""
+        link_entity_id = None
+        if case["link"]:
+            shot = mock_sg.create(
+                "Shot",
+                {
+                    "code": _unique("TEST_SHOT"),
+                    "project": {"type": "Project", "id": test_project["id"]},
+                },
+            )
+            link_entity_id = shot["id"]
+
+        note = _make_note(mock_sg, test_project, case, test_user if case.get("with_user") else None, link_entity_id)
 
         # Create response
         response = NoteCreateResponse(
@@ -104,48 +182,54 @@ class TestNoteTools:
         # Verify response
         assert response.id is not None
         assert response.type == "Note"
-        assert response.subject == "Test Note"
-        assert response.content == "This is a test note"
+        assert response.subject == case["subject"]
+        assert response.content == case["content"]
+
+        # Verify the created note; Mockgun returns the fields as stored, so no need to query it back
+        assert note["project"]["id"] == test_project["id"]
+        if case.get("with_user"):
+            assert note["user"]["id"] == test_user["id"]
+            assert len(note["addressings_to"]) == 1
+            assert note["addressings_to"][0]["id"] == test_user["id"]
+
+    def test_note_round_trip(self, mock_sg: Shotgun, test_project: dict, test_user: dict):
+        """Test that a created note reads back from ShotGrid with the same fields."""
+        case = {"subject": "Round Trip Note", "content": "This note is read back after creation"}
+        note = _make_note(mock_sg, test_project, case, test_user)
 
         # Verify note was created in ShotGrid
-        note = mock_sg.find_one("Note", [["id", "is", response.id]])
-        assert note is not None
-        assert note["subject"] == "Test Note"
-        assert note["content"] == "This is a test note"
-        assert note["project"]["id"] == project["id"]
-        assert note["user"]["id"] == user["id"]
-        assert len(note["addressings_to"]) == 1
-        assert note["addressings_to"][0]["id"] == user["id"]
-
-    def test_create_note_returns_sg_url(self, mock_sg: Shotgun):
-        """Test that create_note function returns sg_url field."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
+        stored = mock_sg.find_one("Note", [["id", "is", note["id"]]], ["subject", "content", "project", "user"])
+        assert stored is not None
+        assert stored["subject"] == case["subject"]
+        assert stored["content"] == case["content"]
+        assert stored["project"]["id"] == test_project["id"]
+        assert stored["user"]["id"] == test_user["id"]
 
-        # Create test user
-        user = mock_sg.create(
-            "HumanUser",
-            {
-                "name": "Test User",
-                "login": "test_user",
-            },
-        )
+    def test_note_request_models(self):
+        """Test that the note request models validate their fields."""
+        create_request = NoteCreateRequest(project_id=1, subject="Subject", content="Content", addressings_to=[2])
+        assert create_request.user_id is None
+        assert create_request.addressings_to == [2]
+
+        update_request = NoteUpdateRequest(id=1, subject="Updated Subject")
+        assert update_request.content is None
 
+        with pytest.raises(ValidationError):
+            NoteCreateRequest(project_id=1, subject="Missing content")
+
+        with pytest.raises(ValidationError):
+            NoteUpdateRequest(subject="Missing id")
+
+    def test_create_note_returns_sg_url(self, mock_sg: Shotgun, test_project: dict, test_user: dict):
+        """Test that create_note function returns sg_url field."""
         # Create note directly using mock_sg
         note = mock_sg.create(
             "Note",
             {
                 "subject": "Test Note with URL",
                 "content": "This note should have an sg_url",
-                "project": {"type": "Project", "id": project["id"]},
-                "user": {"type": "HumanUser", "id": user["id"]},
+                "project": {"type": "Project", "id": test_project["id"]},
+                "user": {"type": "HumanUser", "id": test_user["id"]},
             },
         )
 
@@ -158,42 +242,23 @@ class TestNoteTools:
         sg_url = generate_entity_url(mock_sg.base_url, "Note", note["id"])
         assert sg_url == f"https://test.shotgunstudio.com/detail/Note/{note['id']}"
 
-    def test_create_note_function_returns_sg_url(self, mock_sg: Shotgun):
+    def test_create_note_function_returns_sg_url(self, mock_sg: Shotgun, test_project: dict, test_user: dict):
         """Test that create_note function directly returns sg_url field."""
         from unittest.mock import MagicMock
 
         from shotgrid_mcp_server.models import NoteCreateRequest
         from shotgrid_mcp_server.tools.note_tools import create_note
 
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test user
-        user = mock_sg.create(
-            "HumanUser",
-            {
-                "name": "Test User",
-                "login": "test_user",
-            },
-        )
-
         # Create a mock context with the mock_sg connection
         mock_context = MagicMock()
         mock_context.connection = mock_sg
 
         # Create note request
         request = NoteCreateRequest(
-            project_id=project["id"],
+            project_id=test_project["id"],
             subject="Test Note with URL",
             content="This note should have an sg_url",
-            user_id=user["id"],
+            user_id=test_user["id"],
         )
 
         # Call create_note function directly
@@ -205,109 +270,19 @@ class TestNoteTools:
         assert result.sg_url is not None
         assert result.sg_url == f"https://test.shotgunstudio.com/detail/Note/{result.id}"
 
-    def test_create_note_with_link(self, mock_sg: Shotgun):
-        """Test create_note function with link to entity."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test shot
-        shot = mock_sg.create(
-            "Shot",
-            {
-                "code": "TEST_SHOT",
-                "project": {"type": "Project", "id": project["id"]},
-            },
-        )
-
-        # Create request
-        request = NoteCreateRequest(
-            project_id=project["id"],
-            subject="Test Note with Link",
-            content="This is a test note with link",
-            link_entity_type="Shot",
-            link_entity_id=shot["id"],
-        )
-
-        # Create note directly using mock_sg
-        note_data = {
-            "project": {"type": "Project", "id": request.project_id},
-            "subject": request.subject,
-            "content": request.content,
-            "note_links": [],  # Initialize empty note_links
-            "created_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default created_at
-            "updated_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default updated_at
-        }
-
-        # Add optional fields
-        if request.link_entity_type and request.link_entity_id:
-            # Note: In Mockgun, note_links only accepts Version type
-            # We'll skip adding note_links for this test
-            pass
-
-        # Create note
-        note = mock_sg.create("Note", note_data)
-
-        # Create response
-        response = NoteCreateResponse(
-            id=note["id"],
-            type="Note",
-            subject=note["subject"],
-            content=note.get("content", ""),
-            created_at=str(note.get("created_at", "")),
-        )
-
-        # Verify response
-        assert response.id is not None
-        assert response.subject == "Test Note with Link"
-
-        # Verify note was created in ShotGrid
-        note = mock_sg.find_one("Note", [["id", "is", response.id]])
-        assert note is not None
-        # Since we couldn't add note_links, we'll just verify the note exists
-
-    def test_read_note(self, mock_sg: Shotgun):
+    def test_read_note(self, mock_sg: Shotgun, test_project: dict, test_user: dict):
         """Test read_note function."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test user
-        user = mock_sg.create(
-            "HumanUser",
-            {
-                "name": "Test User",
-                "login": "test_user",
-            },
-        )
-
         # No need to create a test shot for this test
 
         # Create test note
         note = mock_sg.create(
             "Note",
             {
+                **_base_note(test_project["id"]),
                 "subject": "Test Note for Reading",
                 "content": "This is a test note for reading",
-                "project": {"type": "Project", "id": project["id"]},
-                "user": {"type": "HumanUser", "id": user["id"]},
-                # Note: In Mockgun, note_links only accepts Version type
-                "note_links": [],
-                "addressings_to": [{"type": "HumanUser", "id": user["id"]}],
-                "created_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default created_at
-                "updated_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default updated_at
+                "user": {"type": "HumanUser", "id": test_user["id"]},
+                "addressings_to": [{"type": "HumanUser", "id": test_user["id"]}],
             },
         )
 
@@ -359,12 +334,12 @@ class TestNoteTools:
         assert response.type == "Note"
         assert response.subject == "Test Note for Reading"
         assert response.content == "This is a test note for reading"
-        assert response.user_id == user["id"]
+        assert response.user_id == test_user["id"]
         # Since we couldn't add note_links, these should be None
         assert response.link_entity_type is None
         assert response.link_entity_id is None
         assert len(response.addressings_to) == 1
-        assert response.addressings_to[0] == user["id"]
+        assert response.addressings_to[0] == test_user["id"]
 
     def test_read_note_not_found(self, mock_sg: Shotgun):
         """Test read_note function with non-existent note."""
@@ -374,135 +349,77 @@ class TestNoteTools:
         non_existent_note = mock_sg.find_one("Note", [["id", "is", 9999]])
         assert non_existent_note is None
 
-    def test_update_note(self, mock_sg: Shotgun):
-        """Test update_note function."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
+    @pytest.mark.parametrize(
+        "update_text, update_link",
+        [(True, False), (False, True), (True, True)],
+        ids=["subject_only", "link_only", "both"],
+    )
+    def test_update_note(self, mock_sg: Shotgun, test_project: dict, update_text: bool, update_link: bool):
+        """Test update_note function, updating the subject/content, the link, or both."""
         # Create test note
         note = mock_sg.create(
             "Note",
             {
+                **_base_note(test_project["id"]),
                 "subject": "Original Subject",
                 "content": "Original content",
-                "project": {"type": "Project", "id": project["id"]},
-                "note_links": [],  # Initialize empty note_links
-                "created_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default created_at
-                "updated_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default updated_at
             },
         )
 
+        # Create test shot to link to
+        shot = None
+        if update_link:
+            shot = mock_sg.create(
+                "Shot",
+                {
+                    "code": _unique("UPDATE_SHOT"),
+                    "project": {"type": "Project", "id": test_project["id"]},
+                },
+            )
+
         # Create request
-        request = NoteUpdateRequest(
-            id=note["id"],
-            subject="Updated Subject",
-            content="Updated content",
-        )
+        request = {
+            "id": note["id"],
+            "subject": "Updated Subject" if update_text else None,
+            "content": "Updated content" if update_text else None,
+            "link_entity_type": "Shot" if shot else None,
+            "link_entity_id": shot["id"] if shot else None,
+        }
 
         # Update note directly using mock_sg
         update_data = {}
 
         # Add fields to update
-        if request.subject is not None:
-            update_data["subject"] = request.subject
+        if request["subject"] is not None:
+            update_data["subject"] = request["subject"]
+
+        if request["content"] is not None:
+            update_data["content"] = request["content"]
 
-        if request.content is not None:
-            update_data["content"] = request.content
+        if request["link_entity_type"] is not None and request["link_entity_id"] is not None:
+            # Note: In Mockgun, note_links only accepts Version type
+            # We'll skip adding note_links for this test
+            pass
 
         # Update note
-        mock_sg.update("Note", request.id, update_data)
+        mock_sg.update("Note", request["id"], update_data)
 
         # Get updated note
-        updated_note = mock_sg.find_one("Note", [["id", "is", request.id]], ["subject", "content", "updated_at"])
+        updated_note = mock_sg.find_one("Note", [["id", "is", request["id"]]], ["subject", "content", "updated_at"])
 
         # Create response
         response = NoteUpdateResponse(
-            id=request.id,
+            id=request["id"],
             type="Note",
             subject=updated_note["subject"],
             content=updated_note.get("content", ""),
             updated_at=str(updated_note.get("updated_at", "")),
         )
 
-        # Verify response
+        # Verify response; a link-only update leaves the text untouched
         assert response.id == note["id"]
-        assert response.subject == "Updated Subject"
-        assert response.content == "Updated content"
-
-        # Verify note was updated in ShotGrid
-        updated_note = mock_sg.find_one("Note", [["id", "is", note["id"]]])
-        assert updated_note["subject"] == "Updated Subject"
-        assert updated_note["content"] == "Updated content"
-
-    def test_update_note_with_link(self, mock_sg: Shotgun):
-        """Test update_note function with link update."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Note Test Project",
-                "code": "note_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test note
-        note = mock_sg.create(
-            "Note",
-            {
-                "subject": "Original Subject",
-                "content": "Original content",
-                "project": {"type": "Project", "id": project["id"]},
-                "note_links": [],  # Initialize empty note_links
-                "created_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default created_at
-                "updated_at": datetime.datetime(2025, 1, 1, 12, 0, 0),  # Add default updated_at
-            },
-        )
-
-        # Create test shot
-        shot = mock_sg.create(
-            "Shot",
-            {
-                "code": "UPDATE_SHOT",
-                "project": {"type": "Project", "id": project["id"]},
-            },
-        )
-
-        # Create request
-        request = NoteUpdateRequest(
-            id=note["id"],
-            link_entity_type="Shot",
-            link_entity_id=shot["id"],
-        )
-
-        # Update note directly using mock_sg
-        update_data = {}
-
-        # Add fields to update
-        if request.link_entity_type is not None and request.link_entity_id is not None:
-            # Note: In Mockgun, note_links only accepts Version type
-            # We'll skip adding note_links for this test
-            pass
-
-        # Update note
-        mock_sg.update("Note", request.id, update_data)
-
-        # Get updated note
-        updated_note = mock_sg.find_one("Note", [["id", "is", request.id]], ["subject", "content", "updated_at"])
-
-        # No need to create a response manually here
-
-        # In Mockgun, note_links only accepts Version type, so we can't verify this
-        # Instead, let's just verify the note still exists
-        updated_note = mock_sg.find_one("Note", [["id", "is", note["id"]]])
-        assert updated_note is not None
+        assert response.subject == ("Updated Subject" if update_text else "Original Subject")
+        assert response.content == ("Updated content" if update_text else "Original content")
 
     @pytest.mark.skip(reason="Test needs to be updated for new API")
     @pytest.mark.asyncio
@@ -512,8 +429,8 @@ class TestNoteTools:
         project = mock_sg.create(
             "Project",
             {
-                "name": "Note Tool Test Project",
-                "code": "note_tool_test",
+                "name": _unique("Note Tool Test Project"),
+                "code": _unique("note_tool_test"),
                 "sg_status": "Active",
             },
         )
@@ -522,8 +439,8 @@ class TestNoteTools:
         user = mock_sg.create(
             "HumanUser",
             {
-                "name": "Tool Test User",
-                "login": "tool_test_user",
+                "name": _unique("Tool Test User"),
+                "login": _unique("tool_test_user"),
                 "email": "tool_test@example.com",
                 "sg_status_list": "act",
             },
@@ -561,8 +478,8 @@ class TestNoteTools:
         project = mock_sg.create(
             "Project",
             {
-                "name": "Note Read Test Project",
-                "code": "note_read_test",
+                "name": _unique("Note Read Test Project"),
+                "code": _unique("note_read_test"),
                 "sg_status": "Active",
             },
         )
@@ -571,8 +488,8 @@ class TestNoteTools:
         user = mock_sg.create(
             "HumanUser",
             {
-                "name": "Read Test User",
-                "login": "read_test_user",
+                "name": _unique("Read Test User"),
+                "login": _unique("read_test_user"),
                 "email": "read_test@example.com",
                 "sg_status_list": "act",
             },
@@ -582,13 +499,11 @@ class TestNoteTools:
         note = mock_sg.create(
             "Note",
             {
-                "project": {"type": "Project", "id": project["id"]},
+                **_base_note(project["id"]),
                 "subject": "Read Test Note",
                 "content": "This is a note for reading via MCP tool",
                 "user": {"type": "HumanUser", "id": user["id"]},
                 "addressings_to": [{"type": "HumanUser", "id": user["id"]}],
-                "created_at": datetime.datetime.now(),
-                "updated_at": datetime.datetime.now(),
             },
         )
 
@@ -609,8 +524,8 @@ class TestNoteTools:
         project = mock_sg.create(
             "Project",
             {
-                "name": "Note Update Test Project",
-                "code": "note_update_test",
+                "name": _unique("Note Update Test Project"),
+                "code": _unique("note_update_test"),
                 "sg_status": "Active",
             },
         )
@@ -619,11 +534,9 @@ class TestNoteTools:
         note = mock_sg.create(
             "Note",
             {
-                "project": {"type": "Project", "id": project["id"]},
+                **_base_note(project["id"]),
                 "subject": "Original Subject",
                 "content": "Original content",
-                "created_at": datetime.datetime.now(),
-                "updated_at": datetime.datetime.now(),
             },
         )
 
@@ -655,6 +568,47 @@ class TestNoteTools:
         assert updated_note["subject"] == "Updated Subject via Tool"
         assert updated_note["content"] == "Updated content via Tool"
 
+    @pytest.mark.asyncio
+    async def test_note_tool_concurrent_ops(
+        self, note_server: FastMCP, mock_sg: Shotgun, test_project: dict, test_user: dict, monkeypatch
+    ):
+        """Test that concurrent note create tool calls don't interfere with each other."""
+        from unittest.mock import MagicMock
+
+        from shotgrid_mcp_server.tools import note_tools
+
+        # ShotGridConnectionContext only accepts real Shotgun connections, so hand the mock
+        # client to the tools directly
+        monkeypatch.setattr(note_tools, "ShotGridConnectionContext", lambda sg: MagicMock(connection=sg))
+
+        subjects = [f"Concurrent Note {i}" for i in range(5)]
+        requests = [
+            {
+                "request": {
+                    "project_id": test_project["id"],
+                    "subject": subject,
+                    "content": f"Content for {subject}",
+                    "user_id": test_user["id"],
+                }
+            }
+            for subject in subjects
+        ]
+
+        # Dispatch every call at once rather than awaiting them one by one
+        results = await asyncio.gather(
+            *(note_server._mcp_call_tool("shotgrid_note_create", request) for request in requests)
+        )
+
+        # Each call gets its own note back, in request order
+        notes = [json.loads(result[0].text) for result in results]
+        assert [note["subject"] for note in notes] == subjects
+        assert len({note["id"] for note in notes}) == len(subjects)
+
+        # Verify every note was stored with its own subject
+        for note in notes:
+            stored = mock_sg.find_one("Note", [["id", "is", note["id"]]], ["subject"])
+            assert stored["subject"] == note["subject"]
+
     @pytest.mark.skip(reason="Test needs to be updated for new API")
     @pytest.mark.asyncio
     async def test_read_note_not_found_tool(self, note_server: FastMCP):
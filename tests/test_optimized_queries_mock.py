@@ -1,200 +0,0 @@
-"""Tests for optimized query methods using MockgunExt."""
-
-# Import third-party modules
-import pytest
-
-# Import local modules
-from shotgrid_mcp_server.mockgun_ext import MockgunExt
-from shotgrid_mcp_server.schema_loader import find_schema_files
-
-
-class TestOptimizedQueriesMock:
-    """Test optimized query methods using MockgunExt."""
-
-    @pytest.fixture
-    def mock_sg(self):
-        """Create a mock ShotGrid instance for testing."""
-        schema_path, schema_entity_path = find_schema_files()
-
-        # Set schema paths before creating the instance
-        MockgunExt.set_schema_paths(schema_path, schema_entity_path)
-
-        # Create the instance
-        sg = MockgunExt(
-            "https://test.shotgunstudio.com",
-            script_name="test_script",
-            api_key="test_key",
-        )
-
-        return sg
-
-    def test_search_entities_with_related(self, mock_sg):
-        """Test search_entities_with_related method."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Test Project",
-                "code": "test_project",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create test sequence
-        sequence = mock_sg.create(
-            "Sequence",
-            {
-                "code": "SEQ001",
-                "project": {"type": "Project", "id": project["id"]},
-                "sg_status_list": "ip",
-            },
-        )
-
-        # Create test shots
-        shots = []
-        for i in range(3):
-            shot = mock_sg.create(
-                "Shot",
-                {
-                    "code": f"SHOT{i+1:03d}",
-                    "project": {"type": "Project", "id": project["id"]},
-                    "sg_sequence": {"type": "Sequence", "id": sequence["id"]},
-                    "sg_status_list": "ip",
-                },
-            )
-            shots.append(shot)
-
-        # Test search with related fields
-        # In a real implementation, we would use field hopping to get related fields
-        # For this test, we'll just use find() with a simpler filter
-        result = mock_sg.find(
-            "Shot",
-            [["project", "is", {"type": "Project", "id": project["id"]}]],
-            ["code", "sg_status_list", "project", "sg_sequence"],
-            page=1,
-        )
-
-        # Verify the result
-        assert result is not None
-        assert len(result) == 3
-
-        # In MockgunExt, the entities might not have a 'type' field
-        # Let's just verify the essential fields are present
-        for entity in result:
-            assert "code" in entity
-            assert "sg_status_list" in entity
-            assert "project" in entity
-            assert "sg_sequence" in entity
-
-    def test_batch_operations(self, mock_sg):
-        """Test batch_operations method."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Batch Test Project",
-                "code": "batch_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create a sequence directly
-        sequence = mock_sg.create(
-            "Sequence",
-            {
-                "code": "BATCH_SEQ",
-                "project": {"type": "Project", "id": project["id"]},
-                "sg_status_list": "ip",
-            },
-        )
-
-        # Create a shot directly
-        shot = mock_sg.create(
-            "Shot",
-            {
-                "code": "BATCH_SHOT",
-                "project": {"type": "Project", "id": project["id"]},
-                "sg_status_list": "ip",
-            },
-        )
-
-        # Verify the entities were created
-        assert sequence is not None
-        assert sequence["type"] == "Sequence"
-        assert sequence["code"] == "BATCH_SEQ"
-        assert shot is not None
-        assert shot["type"] == "Shot"
-        assert shot["code"] == "BATCH_SHOT"
-
-        # Create a sequence and shot for testing update and delete
-        test_sequence = mock_sg.create(
-            "Sequence",
-            {
-                "code": "UPDATE_SEQ",
-                "project": {"type": "Project", "id": project["id"]},
-                "sg_status_list": "ip",
-            },
-        )
-
-        test_shot = mock_sg.create(
-            "Shot",
-            {
-                "code": "DELETE_SHOT",
-                "project": {"type": "Project", "id": project["id"]},
-                "sg_status_list": "ip",
-            },
-        )
-
-        # Update the sequence directly
-        mock_sg.update("Sequence", test_sequence["id"], {"sg_status_list": "fin"})
-
-        # Delete the shot directly
-        mock_sg.delete("Shot", test_shot["id"])
-
-        # Verify sequence was updated
-        updated_sequence = mock_sg.find_one("Sequence", [["id", "is", test_sequence["id"]]])
-        assert updated_sequence["sg_status_list"] == "fin"
-
-        # Verify shot was deleted
-        deleted_shot = mock_sg.find_one("Shot", [["id", "is", test_shot["id"]]])
-        assert deleted_shot is None
-
-    def test_batch_create_entities(self, mock_sg):
-        """Test batch_create_entities method."""
-        # Create test project
-        project = mock_sg.create(
-            "Project",
-            {
-                "name": "Batch Create Test",
-                "code": "batch_create_test",
-                "sg_status": "Active",
-            },
-        )
-
-        # Create shots directly
-        created_shots = []
-        for i in range(5):
-            shot = mock_sg.create(
-                "Shot",
-                {
-                    "code": f"BATCH_SHOT_{i+1:03d}",
-                    "project": {"type": "Project", "id": project["id"]},
-                    "sg_status_list": "ip",
-                },
-            )
-            created_shots.append(shot)
-
-        # Verify the result
-        assert len(created_shots) == 5
-        for i, entity in enumerate(created_shots):
-            # In MockgunExt, the entities might not have a 'type' field
-            assert entity["code"] == f"BATCH_SHOT_{i+1:03d}"
-            assert entity["sg_status_list"] == "ip"
-
-        # Verify entities were created in ShotGrid
-        shots = mock_sg.find(
-            "Shot",
-            [["project", "is", {"type": "Project", "id": project["id"]}]],
-            ["code", "sg_status_list"],
-        )
-        assert len(shots) >= 5